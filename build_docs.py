@@ -1,3 +1,9 @@
+"""Build HTML documentation with Sphinx
+
+Dependencies are pinned in requirements-docs.txt
+
+"""
+
 try:
     # Python 2
     from sphinx.cmdline import main
@@ -6,15 +12,38 @@ except ImportError:
     # Python 3
     from sphinx.cmd.build import main
 
+import argparse
+
 from maya import standalone
 
+parser = argparse.ArgumentParser()
+parser.add_argument("--clean", action="store_true",
+                    help="Discard cached doctrees and rebuild everything")
+parser.add_argument("--jobs", default="auto",
+                    help="Number of parallel Sphinx readers, or 'auto'")
+opt = parser.parse_args()
+
 print("Initializing Maya..")
 standalone.initialize()
 
-# Build with Sphinx
-main([
+argv = [
     "docs/source",
     "build/html",
-    "-E",
-    "-v"
-])
+
+    # Keep pickled doctrees between builds, such that
+    # only modified sources are re-read on the next run
+    "-d", "build/doctrees",
+
+    # Read sources in parallel. Workers are forked from this
+    # process and so inherit the initialised Maya session,
+    # Sphinx falls back to serial where fork is unavailable
+    "-j", opt.jobs,
+
+    "-v",
+]
+
+if opt.clean:
+    argv.append("-E")
+
+# Build with Sphinx
+main(argv)
@@ -2,6 +2,16 @@
 import io
 import re
 
+# Headers, and the fenced Python blocks beneath them
+_BLOCK = re.compile(
+    r"^(?P<header>### [^\n]*)$"
+    r"|^```python[^\n]*\n(?P<body>.*?)^```",
+    re.MULTILINE | re.DOTALL
+)
+
+# Characters unsupported in a function name
+_NON_WORD = re.compile(r"\W")
+
 
 def parse(fname):
     """Return blocks of code as list of dicts
@@ -11,31 +21,28 @@ def parse(fname):
 
     """
 
-    blocks = list()
     with io.open(fname, "r", encoding="utf-8") as f:
-        in_block = False
-        current_block = None
-        current_header = ""
+        text = f.read()
 
-        for number, line in enumerate(f):
-            number += 1
+    blocks = list()
+    current_header = ""
+    number = 1  # Line number, relative `position`
+    position = 0
 
-            # Doctests are within a quadruple hashtag header.
-            if line.startswith("### "):
-                current_header = line.rstrip()
+    for match in _BLOCK.finditer(text):
 
-            # The actuat test is within a fenced block.
-            if line.startswith("```"):
-                in_block = False
+        # Doctests are within a quadruple hashtag header.
+        if match.group("header") is not None:
+            current_header = match.group("header").rstrip()
+            continue
 
-            if in_block:
-                current_block.append(line)
+        # The actual test is within a fenced block.
+        number += text.count("\n", position, match.start())
+        position = match.start()
 
-            if line.startswith("```python"):
-                in_block = True
-                current_block = list()
-                current_block.append(current_header + " L%d" % number)
-                blocks.append(current_block)
+        block = [current_header + " L%d" % number]
+        block.extend(match.group("body").splitlines(True))
+        blocks.append(block)
 
     tests = list()
     for block in blocks:
@@ -46,7 +53,7 @@ def parse(fname):
         )
 
         # Remove unsupported characters
-        header = re.sub(r"\W", "_", header)
+        header = _NON_WORD.sub("_", header)
 
         # Adding "untested" anywhere in the first line of
         # the doctest excludes it from the test.
@@ -80,18 +87,19 @@ def format_(blocks):
             continue
 
         function_count += 1
-        block["header"] = block["header"]
-        block["count"] = str(function_count)
-        block["body"] = "    ".join(block["body"])
-        tests.append(u"""\
 
-def test_{count}_{header}():
-    '''Test {header}
+        # Indent each line as it is written, rather than
+        # joining the body only to copy it into a template
+        buf = io.StringIO()
+        buf.write(u"\ndef test_%d_%s():\n" % (function_count, block["header"]))
+        buf.write(u"    '''Test %s\n\n" % block["header"])
 
-    {body}
-    '''
+        for line in block["body"]:
+            buf.write(u"    ")
+            buf.write(line)
 
-""".format(**block))
+        buf.write(u"\n    '''\n\n")
+        tests.append(buf.getvalue())
 
     return tests
 
@@ -111,18 +119,38 @@ import sys
 import nose
 from nose.tools import assert_raises
 
+
+def new_scene():
+    from maya import cmds
+    cmds.file(new=True, force=True)
+
+
+def setup_module():
+    new_scene()
+
+
+def teardown_module():
+    new_scene()
+
+
 if __name__ == "__main__":
-    print("Initialising Maya..")
     from maya import standalone
-    standalone.initialize()
+
+    # E.g. `--collect-only` needs no Maya
+    skip_maya = os.environ.get("CMDX_SKIP_MAYA") == "1"
+
+    if not skip_maya:
+        print("Initialising Maya..")
+        standalone.initialize()
 
     # For nose
     if sys.version_info[0] == 3:
         import collections
         collections.Callable = collections.abc.Callable
 
-    from maya import cmds
-    import cmdx
+    if not skip_maya:
+        from maya import cmds
+        import cmdx
 
     argv = sys.argv[:]
     argv.extend([
@@ -134,10 +162,10 @@ if __name__ == "__main__":
 
     result = nose.main(argv=argv, exit=False)
 
-    if os.name == "nt":
+    if os.name == "nt" and not skip_maya:
         # Graceful exit, only Windows seems to like this consistently
         standalone.uninitialize()
 
     os._exit(0 if result.success else 1)
 """)
-        f.write("".join(tests))
+        f.writelines(tests)
@@ -1,765 +1,791 @@
+import sys
+
 from maya.api import OpenMaya as om
 
-AISEnvFacade = om.MTypeId(0x52454656)
-AboutToSetValueTestNode = om.MTypeId(0x4153564e)
-AbsOverride = om.MTypeId(0x58000378)
-AbsUniqueOverride = om.MTypeId(0x580003a0)
-AddDoubleLinear = om.MTypeId(0x4441444c)
-AddMatrix = om.MTypeId(0x44414d58)
-AdskMaterial = om.MTypeId(0x4144534d)
-AimConstraint = om.MTypeId(0x44414d43)
-AirField = om.MTypeId(0x59414952)
-AirManip = om.MTypeId(0x554d4958)
-AlignCurve = om.MTypeId(0x4e414c43)
-AlignManip = om.MTypeId(0x554d4144)
-AlignSurface = om.MTypeId(0x4e414c53)
-AmbientLight = om.MTypeId(0x414d424c)
-AngleBetween = om.MTypeId(0x4e414254)
-AngleDimension = om.MTypeId(0x4147444e)
-AnimBlend = om.MTypeId(0x41424e44)
-AnimBlendInOut = om.MTypeId(0x4142494f)
-AnimBlendNodeAdditive = om.MTypeId(0x41424e41)
-AnimBlendNodeAdditiveDA = om.MTypeId(0x41424141)
-AnimBlendNodeAdditiveDL = om.MTypeId(0x4142414c)
-AnimBlendNodeAdditiveF = om.MTypeId(0x41424146)
-AnimBlendNodeAdditiveFA = om.MTypeId(0x41424641)
-AnimBlendNodeAdditiveFL = om.MTypeId(0x4142464c)
-AnimBlendNodeAdditiveI16 = om.MTypeId(0x41424153)
-AnimBlendNodeAdditiveI32 = om.MTypeId(0x41424149)
-AnimBlendNodeAdditiveRotation = om.MTypeId(0x41424e52)
-AnimBlendNodeAdditiveScale = om.MTypeId(0x41424e53)
-AnimBlendNodeBoolean = om.MTypeId(0x4142424f)
-AnimBlendNodeEnum = om.MTypeId(0x41424e45)
-AnimBlendNodeTime = om.MTypeId(0x41425449)
-AnimClip = om.MTypeId(0x434c504e)
-AnimCurveTA = om.MTypeId(0x50435441)
-AnimCurveTL = om.MTypeId(0x5043544c)
-AnimCurveTT = om.MTypeId(0x50435454)
-AnimCurveTU = om.MTypeId(0x50435455)
-AnimCurveUA = om.MTypeId(0x50435541)
-AnimCurveUL = om.MTypeId(0x5043554c)
-AnimCurveUT = om.MTypeId(0x50435554)
-AnimCurveUU = om.MTypeId(0x50435555)
-AnimLayer = om.MTypeId(0x414e4c52)
-Anisotropic = om.MTypeId(0x52414e49)
-AnnotationShape = om.MTypeId(0x414e4e53)
-AovChildCollection = om.MTypeId(0x5800039c)
-AovCollection = om.MTypeId(0x5800039b)
-ApplyAbs2FloatsOverride = om.MTypeId(0x58000397)
-ApplyAbs3FloatsOverride = om.MTypeId(0x58000381)
-ApplyAbsBoolOverride = om.MTypeId(0x5800038a)
-ApplyAbsEnumOverride = om.MTypeId(0x5800038c)
-ApplyAbsFloatOverride = om.MTypeId(0x5800037d)
-ApplyAbsIntOverride = om.MTypeId(0x58000391)
-ApplyAbsStringOverride = om.MTypeId(0x58000393)
-ApplyConnectionOverride = om.MTypeId(0x58000384)
-ApplyRel2FloatsOverride = om.MTypeId(0x58000399)
-ApplyRel3FloatsOverride = om.MTypeId(0x58000383)
-ApplyRelFloatOverride = om.MTypeId(0x5800037f)
-ApplyRelIntOverride = om.MTypeId(0x58000392)
-ArcLengthDimension = om.MTypeId(0x41444d4e)
-AreaLight = om.MTypeId(0x41524c54)
-ArrayMapper = om.MTypeId(0x44414d50)
-ArrowManip = om.MTypeId(0x554d4152)
-ArubaTessellate = om.MTypeId(0x41544553)
-AttachCurve = om.MTypeId(0x4e415443)
-AttachSurface = om.MTypeId(0x4e415453)
-AttrHierarchyTest = om.MTypeId(0x41544854)
-Audio = om.MTypeId(0x41554449)
-AvgCurves = om.MTypeId(0x4e414352)
-AvgNurbsSurfacePoints = om.MTypeId(0x4e414e50)
-AvgSurfacePoints = om.MTypeId(0x4e415350)
-BallProjManip = om.MTypeId(0x554d4250)
-BarnDoorManip = om.MTypeId(0x554d4c4e)
-BaseLattice = om.MTypeId(0x46424153)
-BasicSelector = om.MTypeId(0x58000375)
-Bevel = om.MTypeId(0x4e42564c)
-BevelPlus = om.MTypeId(0x4e425356)
-BezierCurve = om.MTypeId(0x42435256)
-BezierCurveToNurbs = om.MTypeId(0x42544e52)
-BlendColorSets = om.MTypeId(0x50424353)
-BlendColors = om.MTypeId(0x52424c32)
-BlendDevice = om.MTypeId(0x424c4456)
-BlendShape = om.MTypeId(0x46424c53)
-BlendTwoAttr = om.MTypeId(0x41424c32)
-BlendWeighted = om.MTypeId(0x41424c57)
-BlindDataTemplate = om.MTypeId(0x424c4454)
-Blinn = om.MTypeId(0x52424c4e)
-BoneLattice = om.MTypeId(0x4642554c)
-Boolean = om.MTypeId(0x4e424f4c)
-Boundary = om.MTypeId(0x4e424e44)
-Brownian = om.MTypeId(0x5246424d)
-Brush = om.MTypeId(0x42525348)
-Bulge = om.MTypeId(0x52544255)
-Bump2d = om.MTypeId(0x5242554d)
-Bump3d = om.MTypeId(0x52425533)
-ButtonManip = om.MTypeId(0x55465054)
-CacheBlend = om.MTypeId(0x4354524b)
-CacheFile = om.MTypeId(0x43434846)
-Camera = om.MTypeId(0x4443414d)
-CameraManip = om.MTypeId(0x554d4958)
-CameraPlaneManip = om.MTypeId(0x554d4350)
-CameraSet = om.MTypeId(0x44525452)
-CameraView = om.MTypeId(0x44434156)
-CenterManip = om.MTypeId(0x434e4d50)
-Character = om.MTypeId(0x43484152)
-CharacterMap = om.MTypeId(0x434d4150)
-CharacterOffset = om.MTypeId(0x584f4646)
-Checker = om.MTypeId(0x52544348)
-Choice = om.MTypeId(0x43484345)
-Chooser = om.MTypeId(0x43484f4f)
-CircleManip = om.MTypeId(0x554d434c)
-CircleSweepManip = om.MTypeId(0x5543534d)
-Clamp = om.MTypeId(0x52434c33)
-ClipGhostShape = om.MTypeId(0x43475348)
-ClipLibrary = om.MTypeId(0x434c4950)
-ClipScheduler = om.MTypeId(0x43534348)
-ClipToGhostData = om.MTypeId(0x43324744)
-CloseCurve = om.MTypeId(0x4e434355)
-CloseSurface = om.MTypeId(0x4e435355)
-ClosestPointOnMesh = om.MTypeId(0x43504f4d)
-ClosestPointOnSurface = om.MTypeId(0x4e435053)
-Cloth = om.MTypeId(0x5254434c)
-Cloud = om.MTypeId(0x52544344)
-Cluster = om.MTypeId(0x46434c53)
-ClusterFlexorShape = om.MTypeId(0x464a4346)
-ClusterHandle = om.MTypeId(0x46434c48)
-CoiManip = om.MTypeId(0x55465054)
-Collection = om.MTypeId(0x58000373)
-CollisionModel = om.MTypeId(0x59434f4c)
-ColorManagementGlobals = om.MTypeId(0x434d4742)
-ColorProfile = om.MTypeId(0x434f4c50)
-CombinationShape = om.MTypeId(0x46434e53)
-CompactPlugArrayTest = om.MTypeId(0x43504154)
-ComponentManip = om.MTypeId(0x5554544d)
-ConcentricProjManip = om.MTypeId(0x554d434f)
-Condition = om.MTypeId(0x52434e44)
-ConnectionOverride = om.MTypeId(0x58000385)
-ConnectionUniqueOverride = om.MTypeId(0x580003a2)
-Container = om.MTypeId(0x434f4e54)
-ContainerBase = om.MTypeId(0x434f4241)
-Contrast = om.MTypeId(0x52434f4e)
-Controller = om.MTypeId(0x43475250)
-CopyColorSet = om.MTypeId(0x43504353)
-CopyUVSet = om.MTypeId(0x43505553)
-CpManip = om.MTypeId(0x554d4350)
-Crater = om.MTypeId(0x52533430)
-CreaseSet = om.MTypeId(0x43524541)
-CreateColorSet = om.MTypeId(0x43524353)
-CreateUVSet = om.MTypeId(0x43525553)
-CubicProjManip = om.MTypeId(0x554d4355)
-CurveFromMeshCoM = om.MTypeId(0x4e434d43)
-CurveFromMeshEdge = om.MTypeId(0x4e434d45)
-CurveFromSubdivEdge = om.MTypeId(0x53435345)
-CurveFromSubdivFace = om.MTypeId(0x53435346)
-CurveFromSurfaceBnd = om.MTypeId(0x4e435342)
-CurveFromSurfaceCoS = om.MTypeId(0x4e435343)
-CurveFromSurfaceIso = om.MTypeId(0x4e435349)
-CurveInfo = om.MTypeId(0x4e43494e)
-CurveIntersect = om.MTypeId(0x4e434349)
-CurveNormalizerAngle = om.MTypeId(0x434e5241)
-CurveNormalizerLinear = om.MTypeId(0x434e524c)
-CurveSegmentManip = om.MTypeId(0x554d5043)
-CurveVarGroup = om.MTypeId(0x4e435647)
-CylindricalProjManip = om.MTypeId(0x554d4359)
-DagContainer = om.MTypeId(0x44414743)
-DagPose = om.MTypeId(0x46504f53)
-DataBlockTest = om.MTypeId(0x44425453)
-DefaultLightList = om.MTypeId(0x4445464c)
-DefaultRenderUtilityList = om.MTypeId(0x4452554c)
-DefaultRenderingList = om.MTypeId(0x44524e4c)
-DefaultShaderList = om.MTypeId(0x5244534c)
-DefaultTextureList = om.MTypeId(0x5244544c)
-DeformBend = om.MTypeId(0x46444244)
-DeformFlare = om.MTypeId(0x4644464c)
-DeformSine = om.MTypeId(0x4644534e)
-DeformSquash = om.MTypeId(0x46445351)
-DeformTwist = om.MTypeId(0x46445457)
-DeformWave = om.MTypeId(0x46445756)
-DeleteColorSet = om.MTypeId(0x444c4353)
-DeleteComponent = om.MTypeId(0x44454354)
-DeleteUVSet = om.MTypeId(0x444c4d53)
-DeltaMush = om.MTypeId(0x444c544d)
-DetachCurve = om.MTypeId(0x4e445443)
-DetachSurface = om.MTypeId(0x4e445453)
-DirectedDisc = om.MTypeId(0x44445343)
-DirectionManip = om.MTypeId(0x55465054)
-DirectionalLight = om.MTypeId(0x4449524c)
-DiscManip = om.MTypeId(0x5544534d)
-DiskCache = om.MTypeId(0x44534b43)
-DisplacementShader = om.MTypeId(0x52445348)
-DisplayLayer = om.MTypeId(0x4453504c)
-DisplayLayerManager = om.MTypeId(0x44504c4d)
-DistanceBetween = om.MTypeId(0x44444254)
-DistanceDimShape = om.MTypeId(0x44444d4e)
-DistanceManip = om.MTypeId(0x554d444d)
-Dof = om.MTypeId(0x444f4644)
-DofManip = om.MTypeId(0x554d4350)
-DoubleShadingSwitch = om.MTypeId(0x53574832)
-DpBirailSrf = om.MTypeId(0x4e444253)
-DragField = om.MTypeId(0x59445247)
-DropoffLocator = om.MTypeId(0x444c4354)
-DynAttenuationManip = om.MTypeId(0x554d444d)
-DynController = om.MTypeId(0x5943544c)
-DynGlobals = om.MTypeId(0x5944474c)
-DynHolder = om.MTypeId(0x59484c44)
-DynSpreadManip = om.MTypeId(0x554d444d)
-DynamicConstraint = om.MTypeId(0x44434f4e)
-EditMetadata = om.MTypeId(0x454d5444)
-EditsManager = om.MTypeId(0x454d4752)
-EmitterManip = om.MTypeId(0x554d4958)
-EnableManip = om.MTypeId(0x454e4d50)
-EnvBall = om.MTypeId(0x5245424c)
-EnvChrome = om.MTypeId(0x52454348)
-EnvCube = om.MTypeId(0x52454342)
-EnvFacade = om.MTypeId(0x52454643)
-EnvFog = om.MTypeId(0x52454647)
-EnvSky = om.MTypeId(0x5245534b)
-EnvSphere = om.MTypeId(0x52455350)
-EnvironmentFog = om.MTypeId(0x454e5646)
-ExplodeNurbsShell = om.MTypeId(0x4e455348)
-Expression = om.MTypeId(0x44455850)
-ExtendCurve = om.MTypeId(0x4e455843)
-ExtendSurface = om.MTypeId(0x4e455853)
-Extrude = om.MTypeId(0x4e455852)
-Facade = om.MTypeId(0x4446434e)
-FfBlendSrf = om.MTypeId(0x4e424c54)
-FfBlendSrfObsolete = om.MTypeId(0x4e424c53)
-FfFilletSrf = om.MTypeId(0x4e464653)
-Ffd = om.MTypeId(0x46464644)
-FieldManip = om.MTypeId(0x554d4958)
-FieldsManip = om.MTypeId(0x554d4958)
-File = om.MTypeId(0x52544654)
-FilletCurve = om.MTypeId(0x4e464352)
-FitBspline = om.MTypeId(0x4e465443)
-FlexorShape = om.MTypeId(0x464c5848)
-Flow = om.MTypeId(0x464c4f57)
-FluidEmitter = om.MTypeId(0x46454d49)
-FluidShape = om.MTypeId(0x464c5549)
-FluidSliceManip = om.MTypeId(0x46534c4d)
-FluidTexture2D = om.MTypeId(0x464c5454)
-FluidTexture3D = om.MTypeId(0x464c5458)
-Follicle = om.MTypeId(0x48435256)
-ForceUpdateManip = om.MTypeId(0x554d4655)
-FosterParent = om.MTypeId(0x4650524e)
-FourByFourMatrix = om.MTypeId(0x4642464d)
-Fractal = om.MTypeId(0x52543246)
-FrameCache = om.MTypeId(0x46434348)
-FreePointManip = om.MTypeId(0x554d4650)
-FreePointTriadManip = om.MTypeId(0x55465054)
-GammaCorrect = om.MTypeId(0x5247414d)
-GeoConnectable = om.MTypeId(0x5947434f)
-GeoConnector = om.MTypeId(0x59474354)
-GeomBind = om.MTypeId(0x4742494e)
-GeometryConstraint = om.MTypeId(0x44474e43)
-GeometryFilter = om.MTypeId(0x44474649)
-GeometryOnLineManip = om.MTypeId(0x554d474c)
-GeometryVarGroup = om.MTypeId(0x4e475647)
-GlobalCacheControl = om.MTypeId(0x4743434c)
-GlobalStitch = om.MTypeId(0x4e475354)
-Granite = om.MTypeId(0x52544752)
-GravityField = om.MTypeId(0x59475241)
-GreasePencilSequence = om.MTypeId(0x47505351)
-GreasePlane = om.MTypeId(0x4447504c)
-GreasePlaneRenderShape = om.MTypeId(0x47505253)
-Grid = om.MTypeId(0x52544744)
-GroupId = om.MTypeId(0x47504944)
-GroupParts = om.MTypeId(0x47525050)
-Guide = om.MTypeId(0x46475549)
-HairConstraint = om.MTypeId(0x4850494e)
-HairSystem = om.MTypeId(0x48535953)
-HairTubeShader = om.MTypeId(0x52485442)
-HardenPoint = om.MTypeId(0x4e484450)
-HardwareRenderGlobals = om.MTypeId(0x48575247)
-HardwareRenderingGlobals = om.MTypeId(0x48525247)
-HeightField = om.MTypeId(0x4f435050)
-HierarchyTestNode1 = om.MTypeId(0x48544e31)
-HierarchyTestNode2 = om.MTypeId(0x48544e32)
-HierarchyTestNode3 = om.MTypeId(0x48544e33)
-HikEffector = om.MTypeId(0x4446494b)
-HikFKJoint = om.MTypeId(0x4a54494b)
-HikFloorContactMarker = om.MTypeId(0x4846434d)
-HikGroundPlane = om.MTypeId(0x48474e44)
-HikHandle = om.MTypeId(0x4b484948)
-HikIKEffector = om.MTypeId(0x494b4546)
-HikSolver = om.MTypeId(0x4b48494b)
-HistorySwitch = om.MTypeId(0x48495353)
-HoldMatrix = om.MTypeId(0x4450484d)
-HsvToRgb = om.MTypeId(0x52483252)
-HwReflectionMap = om.MTypeId(0x4857524d)
-HwRenderGlobals = om.MTypeId(0x59485244)
-HyperGraphInfo = om.MTypeId(0x48595052)
-HyperLayout = om.MTypeId(0x4859504c)
-HyperView = om.MTypeId(0x44485056)
-IkEffector = om.MTypeId(0x4b454646)
-IkHandle = om.MTypeId(0x4b48444c)
-IkMCsolver = om.MTypeId(0x4b4d4353)
-IkPASolver = om.MTypeId(0x4b504153)
-IkRPsolver = om.MTypeId(0x4b525053)
-IkSCsolver = om.MTypeId(0x4b534353)
-IkSplineSolver = om.MTypeId(0x4b535053)
-IkSystem = om.MTypeId(0x4b535953)
-ImagePlane = om.MTypeId(0x4449504c)
-ImplicitBox = om.MTypeId(0x46494258)
-ImplicitCone = om.MTypeId(0x4649434f)
-ImplicitSphere = om.MTypeId(0x46495350)
-IndexManip = om.MTypeId(0x554d4958)
-InsertKnotCurve = om.MTypeId(0x4e494b43)
-InsertKnotSurface = om.MTypeId(0x4e494b53)
-Instancer = om.MTypeId(0x594e5354)
-IntersectSurface = om.MTypeId(0x4e495346)
-Jiggle = om.MTypeId(0x4a474446)
-Joint = om.MTypeId(0x4a4f494e)
-JointCluster = om.MTypeId(0x464a434c)
-JointFfd = om.MTypeId(0x46464442)
-JointLattice = om.MTypeId(0x4642454c)
-KeyframeRegionManip = om.MTypeId(0x4b46524d)
-KeyingGroup = om.MTypeId(0x4b475250)
-Lambert = om.MTypeId(0x524c414d)
-Lattice = om.MTypeId(0x464c4154)
-LayeredShader = om.MTypeId(0x4c595253)
-LayeredTexture = om.MTypeId(0x4c595254)
-LeastSquaresModifier = om.MTypeId(0x4e4c534d)
-Leather = om.MTypeId(0x52544c45)
-LightEditor = om.MTypeId(0x580003e3)
-LightFog = om.MTypeId(0x52464f47)
-LightGroup = om.MTypeId(0x580003e2)
-LightInfo = om.MTypeId(0x524c494e)
-LightItem = om.MTypeId(0x580003e1)
-LightLinker = om.MTypeId(0x524c4c4b)
-LightList = om.MTypeId(0x4c4c5354)
-LightManip = om.MTypeId(0x554d4958)
-LightsChildCollection = om.MTypeId(0x5800039a)
-LightsCollection = om.MTypeId(0x58000394)
-LightsCollectionSelector = om.MTypeId(0x580003a4)
-LimitManip = om.MTypeId(0x4c544d50)
-LineManip = om.MTypeId(0x554d4c4e)
-LineModifier = om.MTypeId(0x4c4d4f44)
-Locator = om.MTypeId(0x4c4f4354)
-LodGroup = om.MTypeId(0x4c4f4447)
-LodThresholds = om.MTypeId(0x4c4f4454)
-Loft = om.MTypeId(0x4e534b4e)
-LookAt = om.MTypeId(0x444c4154)
-Luminance = om.MTypeId(0x524c554d)
-MakeGroup = om.MTypeId(0x504d4752)
-MakeIllustratorCurves = om.MTypeId(0x4e4d4943)
-MakeNurbCircle = om.MTypeId(0x4e435243)
-MakeNurbCone = om.MTypeId(0x4e434e45)
-MakeNurbCube = om.MTypeId(0x4e435542)
-MakeNurbCylinder = om.MTypeId(0x4e43594c)
-MakeNurbPlane = om.MTypeId(0x4e504c4e)
-MakeNurbSphere = om.MTypeId(0x4e535048)
-MakeNurbTorus = om.MTypeId(0x4e544f52)
-MakeNurbsSquare = om.MTypeId(0x4e535152)
-MakeTextCurves = om.MTypeId(0x4e545843)
-MakeThreePointCircularArc = om.MTypeId(0x4e334341)
-MakeTwoPointCircularArc = om.MTypeId(0x4e324341)
-Mandelbrot = om.MTypeId(0x52544d41)
-Mandelbrot3D = om.MTypeId(0x52544d33)
-Manip2DContainer = om.MTypeId(0x554d3243)
-ManipContainer = om.MTypeId(0x554d4343)
-Marble = om.MTypeId(0x52544d52)
-MarkerManip = om.MTypeId(0x554d4d41)
-MaterialFacade = om.MTypeId(0x524d4643)
-MaterialInfo = om.MTypeId(0x444d5449)
-MaterialOverride = om.MTypeId(0x58000387)
-Membrane = om.MTypeId(0x4d454d42)
-Mesh = om.MTypeId(0x444d5348)
-MeshVarGroup = om.MTypeId(0x4e4d5647)
-MotionPath = om.MTypeId(0x4d505448)
-MotionPathManip = om.MTypeId(0x554d4d41)
-MotionTrail = om.MTypeId(0x4d4f5452)
-MotionTrailShape = om.MTypeId(0x4d4f5348)
-Mountain = om.MTypeId(0x52544d54)
-MoveVertexManip = om.MTypeId(0x554d4650)
-Movie = om.MTypeId(0x52544d56)
-MpBirailSrf = om.MTypeId(0x4e4d4253)
-MultDoubleLinear = om.MTypeId(0x444d444c)
-MultMatrix = om.MTypeId(0x444d544d)
-MultilisterLight = om.MTypeId(0x4d554c4c)
-MultiplyDivide = om.MTypeId(0x524d4449)
-Mute = om.MTypeId(0x4d555445)
-NCloth = om.MTypeId(0x4e434c4f)
-NComponent = om.MTypeId(0x4e434d50)
-NParticle = om.MTypeId(0x4e504152)
-NRigid = om.MTypeId(0x4e524744)
-NearestPointOnCurve = om.MTypeId(0x4e504f43)
-Network = om.MTypeId(0x4e54574b)
-NewtonField = om.MTypeId(0x594e4557)
-NewtonManip = om.MTypeId(0x554d4958)
-Noise = om.MTypeId(0x52544e33)
-NonLinear = om.MTypeId(0x464e4c44)
-NormalConstraint = om.MTypeId(0x444e4332)
-Nucleus = om.MTypeId(0x4e535953)
-NurbsCurve = om.MTypeId(0x4e435256)
-NurbsCurveToBezier = om.MTypeId(0x4e525442)
-NurbsSurface = om.MTypeId(0x4e535246)
-NurbsTessellate = om.MTypeId(0x4e544553)
-NurbsToSubdiv = om.MTypeId(0x534e5453)
-NurbsToSubdivProc = om.MTypeId(0x534e5450)
-ObjectAttrFilter = om.MTypeId(0x4f464154)
-ObjectBinFilter = om.MTypeId(0x4f4b464c)
-ObjectFilter = om.MTypeId(0x4f464c54)
-ObjectMultiFilter = om.MTypeId(0x4f4d464c)
-ObjectNameFilter = om.MTypeId(0x4f4e464c)
-ObjectRenderFilter = om.MTypeId(0x4f52464c)
-ObjectScriptFilter = om.MTypeId(0x4f53464c)
-ObjectSet = om.MTypeId(0x4f425354)
-ObjectTypeFilter = om.MTypeId(0x4f54464c)
-Ocean = om.MTypeId(0x52544f43)
-OceanShader = om.MTypeId(0x524f5053)
-OffsetCos = om.MTypeId(0x4e4f4353)
-OffsetCurve = om.MTypeId(0x4e4f4355)
-OffsetSurface = om.MTypeId(0x4e4f5355)
-OldBlindDataBase = om.MTypeId(0x42444454)
-OldGeometryConstraint = om.MTypeId(0x44474d43)
-OldNormalConstraint = om.MTypeId(0x444e5243)
-OldTangentConstraint = om.MTypeId(0x44544e43)
-OpticalFX = om.MTypeId(0x4f504658)
-OrientConstraint = om.MTypeId(0x444f5243)
-OrientationMarker = om.MTypeId(0x4f52544d)
-PairBlend = om.MTypeId(0x4150424c)
-ParamDimension = om.MTypeId(0x52444d4e)
-ParentConstraint = om.MTypeId(0x44504152)
-Particle = om.MTypeId(0x59504152)
-ParticleAgeMapper = om.MTypeId(0x50414d41)
-ParticleCloud = om.MTypeId(0x50434c44)
-ParticleColorMapper = om.MTypeId(0x50434d41)
-ParticleIncandMapper = om.MTypeId(0x50494d41)
-ParticleSamplerInfo = om.MTypeId(0x5053494e)
-ParticleTranspMapper = om.MTypeId(0x50544d41)
-Partition = om.MTypeId(0x5052544e)
-PassContributionMap = om.MTypeId(0x5053434d)
-PassMatrix = om.MTypeId(0x4450534d)
-PfxHair = om.MTypeId(0x50464841)
-PfxToon = om.MTypeId(0x5046544f)
-Phong = om.MTypeId(0x5250484f)
-PhongE = om.MTypeId(0x52504845)
-PivotAndOrientManip = om.MTypeId(0x50414f4d)
-Place2dTexture = om.MTypeId(0x52504c32)
-Place3dTexture = om.MTypeId(0x52504c44)
-PlanarProjManip = om.MTypeId(0x554d5050)
-PlanarTrimSurface = om.MTypeId(0x4e504c54)
-PlusMinusAverage = om.MTypeId(0x52504d41)
-PointConstraint = om.MTypeId(0x44505443)
-PointEmitter = om.MTypeId(0x59454d49)
-PointLight = om.MTypeId(0x504f4954)
-PointMatrixMult = om.MTypeId(0x44504d4d)
-PointOnCurveInfo = om.MTypeId(0x4e504349)
-PointOnCurveManip = om.MTypeId(0x554d5043)
-PointOnLineManip = om.MTypeId(0x554d504c)
-PointOnPolyConstraint = om.MTypeId(0x44505043)
-PointOnSurfManip = om.MTypeId(0x554d5353)
-PointOnSurfaceInfo = om.MTypeId(0x4e505349)
-PointOnSurfaceManip = om.MTypeId(0x554d5053)
-PoleVectorConstraint = om.MTypeId(0x44505643)
-PolyAppend = om.MTypeId(0x50415050)
-PolyAppendVertex = om.MTypeId(0x50415056)
-PolyAutoProj = om.MTypeId(0x50415550)
-PolyAverageVertex = om.MTypeId(0x50415656)
-PolyBevel = om.MTypeId(0x5042564c)
-PolyBevel2 = om.MTypeId(0x50425632)
-PolyBevel3 = om.MTypeId(0x50425633)
-PolyBlindData = om.MTypeId(0x4d424454)
-PolyBoolOp = om.MTypeId(0x50424f50)
-PolyBridgeEdge = om.MTypeId(0x50425245)
-PolyCBoolOp = om.MTypeId(0x50435642)
-PolyChipOff = om.MTypeId(0x50434849)
-PolyCircularize = om.MTypeId(0x50435243)
-PolyClean = om.MTypeId(0x504c434c)
-PolyCloseBorder = om.MTypeId(0x50434c4f)
-PolyCollapseEdge = om.MTypeId(0x50434f45)
-PolyCollapseF = om.MTypeId(0x50434f46)
-PolyColorDel = om.MTypeId(0x5043444c)
-PolyColorMod = om.MTypeId(0x50434d4f)
-PolyColorPerVertex = om.MTypeId(0x50435056)
-PolyCone = om.MTypeId(0x50434f4e)
-PolyConnectComponents = om.MTypeId(0x50434353)
-PolyContourProj = om.MTypeId(0x50434e50)
-PolyCopyUV = om.MTypeId(0x50435556)
-PolyCrease = om.MTypeId(0x50435253)
-PolyCreaseEdge = om.MTypeId(0x50435345)
-PolyCreateFace = om.MTypeId(0x50435245)
-PolyCube = om.MTypeId(0x50435542)
-PolyCut = om.MTypeId(0x50504354)
-PolyCylProj = om.MTypeId(0x50435950)
-PolyCylinder = om.MTypeId(0x5043594c)
-PolyDelEdge = om.MTypeId(0x50444545)
-PolyDelFacet = om.MTypeId(0x50444546)
-PolyDelVertex = om.MTypeId(0x50444556)
-PolyDuplicateEdge = om.MTypeId(0x50445545)
-PolyEdgeToCurve = om.MTypeId(0x50544356)
-PolyEditEdgeFlow = om.MTypeId(0x50534546)
-PolyExtrudeEdge = om.MTypeId(0x50455845)
-PolyExtrudeFace = om.MTypeId(0x50455846)
-PolyExtrudeVertex = om.MTypeId(0x50455856)
-PolyFlipEdge = om.MTypeId(0x50464c45)
-PolyFlipUV = om.MTypeId(0x50465556)
-PolyHelix = om.MTypeId(0x48454c49)
-PolyHoleFace = om.MTypeId(0x50484645)
-PolyLayoutUV = om.MTypeId(0x504c5556)
-PolyMapCut = om.MTypeId(0x504d4143)
-PolyMapDel = om.MTypeId(0x504d4144)
-PolyMapSew = om.MTypeId(0x504d4153)
-PolyMapSewMove = om.MTypeId(0x5053454d)
-PolyMergeEdge = om.MTypeId(0x504d4545)
-PolyMergeFace = om.MTypeId(0x504d4546)
-PolyMergeUV = om.MTypeId(0x504d4755)
-PolyMergeVert = om.MTypeId(0x504d5645)
-PolyMirror = om.MTypeId(0x504d4952)
-PolyMoveEdge = om.MTypeId(0x504d4f45)
-PolyMoveFace = om.MTypeId(0x504d4f46)
-PolyMoveFacetUV = om.MTypeId(0x504d4655)
-PolyMoveUV = om.MTypeId(0x504d5556)
-PolyMoveVertex = om.MTypeId(0x504d4f56)
-PolyNormal = om.MTypeId(0x504e4f52)
-PolyNormalPerVertex = om.MTypeId(0x504e5056)
-PolyNormalizeUV = om.MTypeId(0x504e5556)
-PolyOptUvs = om.MTypeId(0x504f5556)
-PolyPassThru = om.MTypeId(0x50595054)
-PolyPinUV = om.MTypeId(0x50505556)
-PolyPipe = om.MTypeId(0x50504950)
-PolyPlanarProj = om.MTypeId(0x50504c50)
-PolyPlane = om.MTypeId(0x504d4553)
-PolyPlatonicSolid = om.MTypeId(0x534f4c49)
-PolyPoke = om.MTypeId(0x5050504b)
-PolyPrimitiveMisc = om.MTypeId(0x4d495343)
-PolyPrism = om.MTypeId(0x50505249)
-PolyProj = om.MTypeId(0x5050524f)
-PolyProjectCurve = om.MTypeId(0x50504356)
-PolyPyramid = om.MTypeId(0x50505952)
-PolyQuad = om.MTypeId(0x50515541)
-PolyReduce = om.MTypeId(0x50524544)
-PolyRemesh = om.MTypeId(0x50524d48)
-PolyRetopo = om.MTypeId(0x5052464d)
-PolySeparate = om.MTypeId(0x50534550)
-PolySewEdge = om.MTypeId(0x50535745)
-PolySmooth = om.MTypeId(0x50534d54)
-PolySmoothFace = om.MTypeId(0x50534d46)
-PolySmoothProxy = om.MTypeId(0x50534d50)
-PolySoftEdge = om.MTypeId(0x50534f45)
-PolySphProj = om.MTypeId(0x50535050)
-PolySphere = om.MTypeId(0x50535048)
-PolySpinEdge = om.MTypeId(0x50535051)
-PolySplit = om.MTypeId(0x5053504c)
-PolySplitEdge = om.MTypeId(0x50534544)
-PolySplitRing = om.MTypeId(0x50535052)
-PolySplitVert = om.MTypeId(0x50535645)
-PolyStraightenUVBorder = om.MTypeId(0x50535442)
-PolySubdEdge = om.MTypeId(0x50535545)
-PolySubdFace = om.MTypeId(0x50535546)
-PolyToSubdiv = om.MTypeId(0x50534453)
-PolyTorus = om.MTypeId(0x50544f52)
-PolyTransfer = om.MTypeId(0x50544652)
-PolyTriangulate = om.MTypeId(0x50545249)
-PolyTweak = om.MTypeId(0x5054574b)
-PolyTweakUV = om.MTypeId(0x50545556)
-PolyUVRectangle = om.MTypeId(0x50555652)
-PolyUnite = om.MTypeId(0x50554e49)
-PolyWedgeFace = om.MTypeId(0x50574643)
-PoseInterpolatorManager = om.MTypeId(0x5053444d)
-PositionMarker = om.MTypeId(0x504f534d)
-PostProcessList = om.MTypeId(0x50505354)
-ProjectCurve = om.MTypeId(0x4e504352)
-ProjectTangent = om.MTypeId(0x4e50544e)
-Projection = om.MTypeId(0x5250524a)
-ProjectionManip = om.MTypeId(0x554d4354)
-PropModManip = om.MTypeId(0x554d4354)
-PropMoveTriadManip = om.MTypeId(0x554d5054)
-ProxyManager = om.MTypeId(0x50584d47)
-PsdFileTex = om.MTypeId(0x50534454)
-QuadPtOnLineManip = om.MTypeId(0x554d504c)
-QuadShadingSwitch = om.MTypeId(0x53574834)
-RadialField = om.MTypeId(0x59524144)
-Ramp = om.MTypeId(0x52545241)
-RampShader = om.MTypeId(0x52525053)
-RbfSrf = om.MTypeId(0x4e524246)
-RebuildCurve = om.MTypeId(0x4e524243)
-RebuildSurface = om.MTypeId(0x4e524253)
-Record = om.MTypeId(0x52454344)
-Reference = om.MTypeId(0x5245464e)
-RelOverride = om.MTypeId(0x5800037a)
-RelUniqueOverride = om.MTypeId(0x580003a1)
-RemapColor = om.MTypeId(0x524d434c)
-RemapHsv = om.MTypeId(0x524d4853)
-RemapValue = om.MTypeId(0x524d564c)
-RenderBox = om.MTypeId(0x524e4258)
-RenderCone = om.MTypeId(0x524e434f)
-RenderGlobals = om.MTypeId(0x52474c42)
-RenderGlobalsList = om.MTypeId(0x5244474c)
-RenderLayer = om.MTypeId(0x524e444c)
-RenderLayerManager = om.MTypeId(0x524e4c4d)
-RenderPass = om.MTypeId(0x524e5053)
-RenderPassSet = om.MTypeId(0x52505353)
-RenderQuality = om.MTypeId(0x52515541)
-RenderRect = om.MTypeId(0x52524354)
-RenderSettingsChildCollection = om.MTypeId(0x580003a3)
-RenderSettingsCollection = om.MTypeId(0x58000395)
-RenderSetup = om.MTypeId(0x58000371)
-RenderSetupLayer = om.MTypeId(0x58000372)
-RenderSphere = om.MTypeId(0x524e5350)
-RenderTarget = om.MTypeId(0x524e5447)
-RenderedImageSource = om.MTypeId(0x52434953)
-ReorderUVSet = om.MTypeId(0x524f5553)
-Resolution = om.MTypeId(0x524c544e)
-ResultCurveTimeToAngular = om.MTypeId(0x52435441)
-ResultCurveTimeToLinear = om.MTypeId(0x5243544c)
-ResultCurveTimeToTime = om.MTypeId(0x52435454)
-ResultCurveTimeToUnitless = om.MTypeId(0x52435455)
-Reverse = om.MTypeId(0x52525653)
-ReverseCurve = om.MTypeId(0x4e525643)
-ReverseSurface = om.MTypeId(0x4e525653)
-Revolve = om.MTypeId(0x4e52564c)
-RgbToHsv = om.MTypeId(0x52523248)
-RigidBody = om.MTypeId(0x59524744)
-RigidConstraint = om.MTypeId(0x59435354)
-RigidSolver = om.MTypeId(0x59534c56)
-Rock = om.MTypeId(0x5254524b)
-RotateLimitsManip = om.MTypeId(0x554d524c)
-RotateManip = om.MTypeId(0x554d5241)
-RotateUV2dManip = om.MTypeId(0x5532524f)
-RoundConstantRadius = om.MTypeId(0x4e524352)
-Sampler = om.MTypeId(0x46534d50)
-SamplerInfo = om.MTypeId(0x5253494e)
-ScaleConstraint = om.MTypeId(0x44534343)
-ScaleLimitsManip = om.MTypeId(0x4c544d50)
-ScaleManip = om.MTypeId(0x554d4650)
-ScaleUV2dManip = om.MTypeId(0x55325343)
-ScreenAlignedCircleManip = om.MTypeId(0x5341434d)
-Script = om.MTypeId(0x53435250)
-ScriptManip = om.MTypeId(0x554d5343)
-Sculpt = om.MTypeId(0x46534350)
-SelectionListOperator = om.MTypeId(0x534c4f50)
-SequenceManager = om.MTypeId(0x53514d47)
-Sequencer = om.MTypeId(0x53514e43)
-SetRange = om.MTypeId(0x52524e47)
-ShaderGlow = om.MTypeId(0x5348474c)
-ShaderOverride = om.MTypeId(0x58000386)
-ShadingEngine = om.MTypeId(0x53484144)
-ShadingMap = om.MTypeId(0x53444d50)
-ShapeEditorManager = om.MTypeId(0x53444d4c)
-ShellTessellate = om.MTypeId(0x53544553)
-Shot = om.MTypeId(0x53484f54)
-ShrinkWrap = om.MTypeId(0x53575250)
-SimpleSelector = om.MTypeId(0x5800039e)
-SimpleTestNode = om.MTypeId(0x53544e44)
-SimpleVolumeShader = om.MTypeId(0x53565348)
-SingleShadingSwitch = om.MTypeId(0x53574831)
-SketchPlane = om.MTypeId(0x534b504e)
-SkinBinding = om.MTypeId(0x534b4244)
-SkinCluster = om.MTypeId(0x4653434c)
-SmoothCurve = om.MTypeId(0x4e534d43)
-SmoothTangentSrf = om.MTypeId(0x4e53544e)
-SnapUV2dManip = om.MTypeId(0x5532534e)
-Snapshot = om.MTypeId(0x534e5054)
-SnapshotShape = om.MTypeId(0x53534841)
-Snow = om.MTypeId(0x5254534e)
-SoftMod = om.MTypeId(0x4653534c)
-SoftModHandle = om.MTypeId(0x46535348)
-SolidFractal = om.MTypeId(0x52544633)
-SpBirailSrf = om.MTypeId(0x4e534253)
-SphericalProjManip = om.MTypeId(0x554d5350)
-SpotCylinderManip = om.MTypeId(0x53434d50)
-SpotLight = om.MTypeId(0x5350544c)
-SpotManip = om.MTypeId(0x554d4958)
-Spring = om.MTypeId(0x59535052)
-SquareSrf = om.MTypeId(0x4e535153)
-Stencil = om.MTypeId(0x52545354)
-StereoRigCamera = om.MTypeId(0x53524341)
-StitchAsNurbsShell = om.MTypeId(0x4e535348)
-StitchSrf = om.MTypeId(0x4e535453)
-Stroke = om.MTypeId(0x5354524b)
-StrokeGlobals = om.MTypeId(0x53544b47)
-Stucco = om.MTypeId(0x52533630)
-StyleCurve = om.MTypeId(0x4e535443)
-SubCurve = om.MTypeId(0x4e534243)
-SubSurface = om.MTypeId(0x4e535352)
-SubdAddTopology = om.MTypeId(0x53415459)
-SubdAutoProj = om.MTypeId(0x53415550)
-SubdBlindData = om.MTypeId(0x53424454)
-SubdCleanTopology = om.MTypeId(0x53435459)
-SubdHierBlind = om.MTypeId(0x53485242)
-SubdLayoutUV = om.MTypeId(0x534c5556)
-SubdMapCut = om.MTypeId(0x534d4143)
-SubdMapSewMove = om.MTypeId(0x5353454d)
-SubdPlanarProj = om.MTypeId(0x53504c50)
-SubdTweak = om.MTypeId(0x5354574b)
-SubdTweakUV = om.MTypeId(0x53545556)
-Subdiv = om.MTypeId(0x53445353)
-SubdivCollapse = om.MTypeId(0x53434c50)
-SubdivComponentId = om.MTypeId(0x53534944)
-SubdivReverseFaces = om.MTypeId(0x53525646)
-SubdivSurfaceVarGroup = om.MTypeId(0x53535647)
-SubdivToNurbs = om.MTypeId(0x5344534e)
-SubdivToPoly = om.MTypeId(0x53445350)
-SurfaceInfo = om.MTypeId(0x4e53494e)
-SurfaceLuminance = om.MTypeId(0x52534c55)
-SurfaceShader = om.MTypeId(0x52535348)
-SurfaceVarGroup = om.MTypeId(0x4e535647)
-SymmetryConstraint = om.MTypeId(0x44534d43)
-TangentConstraint = om.MTypeId(0x44544332)
-Tension = om.MTypeId(0x54454e53)
-TextButtonManip = om.MTypeId(0x554d5442)
-Texture3dManip = om.MTypeId(0x554d5458)
-TextureBakeSet = om.MTypeId(0x5442414b)
-TextureDeformer = om.MTypeId(0x54584446)
-TextureDeformerHandle = om.MTypeId(0x54444844)
-TextureToGeom = om.MTypeId(0x5454474f)
-Time = om.MTypeId(0x54494d45)
-TimeEditor = om.MTypeId(0x544d4544)
-TimeEditorAnimSource = om.MTypeId(0x54454153)
-TimeEditorClip = om.MTypeId(0x41434c43)
-TimeEditorClipBase = om.MTypeId(0x414c434c)
-TimeEditorClipEvaluator = om.MTypeId(0x4143524f)
-TimeEditorInterpolator = om.MTypeId(0x54454950)
-TimeEditorTracks = om.MTypeId(0x5445544b)
-TimeFunction = om.MTypeId(0x7466786e)
-TimeToUnitConversion = om.MTypeId(0x44544d55)
-TimeWarp = om.MTypeId(0x54495741)
-ToggleManip = om.MTypeId(0x554d5447)
-ToggleOnLineManip = om.MTypeId(0x55544f4c)
-ToolDrawManip = om.MTypeId(0x5454444d)
-ToolDrawManip2D = om.MTypeId(0x54444d32)
-ToonLineAttributes = om.MTypeId(0x544c4154)
-TrackInfoManager = om.MTypeId(0x54494d47)
-TransUV2dManip = om.MTypeId(0x55325452)
-TransferAttributes = om.MTypeId(0x54524154)
-Transform = om.MTypeId(0x5846524d)
-TransformGeometry = om.MTypeId(0x5447454f)
-TranslateLimitsManip = om.MTypeId(0x434e4d50)
-TranslateManip = om.MTypeId(0x554d4650)
-TranslateUVManip = om.MTypeId(0x554d5556)
-Trim = om.MTypeId(0x4e54524d)
-TrimWithBoundaries = om.MTypeId(0x4e545742)
-TriplanarProjManip = om.MTypeId(0x554d5452)
-TripleShadingSwitch = om.MTypeId(0x53574833)
-TrsInsertManip = om.MTypeId(0x554d4354)
-TrsManip = om.MTypeId(0x5554544d)
-TurbulenceField = om.MTypeId(0x59545552)
-TurbulenceManip = om.MTypeId(0x554d4958)
-Tweak = om.MTypeId(0x464d5054)
-UniformField = om.MTypeId(0x59554e49)
-UnitConversion = om.MTypeId(0x44554e54)
-UnitToTimeConversion = om.MTypeId(0x4455544d)
-Unknown = om.MTypeId(0x554e4b4e)
-UnknownDag = om.MTypeId(0x554e4b44)
-UnknownTransform = om.MTypeId(0x554e4b54)
-Untrim = om.MTypeId(0x4e555452)
-UseBackground = om.MTypeId(0x55534247)
-Uv2dManip = om.MTypeId(0x5556324d)
-UvChooser = om.MTypeId(0x55564348)
-VectorProduct = om.MTypeId(0x52564543)
-VertexBakeSet = om.MTypeId(0x5642414b)
-ViewColorManager = om.MTypeId(0x5657434d)
-VolumeAxisField = om.MTypeId(0x59565846)
-VolumeFog = om.MTypeId(0x52564647)
-VolumeLight = om.MTypeId(0x564f4c4c)
-VolumeNoise = om.MTypeId(0x52545633)
-VolumeShader = om.MTypeId(0x52565348)
-VortexField = om.MTypeId(0x59564f52)
-Water = om.MTypeId(0x52545741)
-WeightGeometryFilter = om.MTypeId(0x44574746)
-Wire = om.MTypeId(0x46574952)
-Wood = om.MTypeId(0x52545744)
-Wrap = om.MTypeId(0x46575250)
-WtAddMatrix = om.MTypeId(0x4457414d)
\ No newline at end of file
+_IDS = {
+    "AISEnvFacade": 0x52454656,
+    "AboutToSetValueTestNode": 0x4153564e,
+    "AbsOverride": 0x58000378,
+    "AbsUniqueOverride": 0x580003a0,
+    "AddDoubleLinear": 0x4441444c,
+    "AddMatrix": 0x44414d58,
+    "AdskMaterial": 0x4144534d,
+    "AimConstraint": 0x44414d43,
+    "AirField": 0x59414952,
+    "AirManip": 0x554d4958,
+    "AlignCurve": 0x4e414c43,
+    "AlignManip": 0x554d4144,
+    "AlignSurface": 0x4e414c53,
+    "AmbientLight": 0x414d424c,
+    "AngleBetween": 0x4e414254,
+    "AngleDimension": 0x4147444e,
+    "AnimBlend": 0x41424e44,
+    "AnimBlendInOut": 0x4142494f,
+    "AnimBlendNodeAdditive": 0x41424e41,
+    "AnimBlendNodeAdditiveDA": 0x41424141,
+    "AnimBlendNodeAdditiveDL": 0x4142414c,
+    "AnimBlendNodeAdditiveF": 0x41424146,
+    "AnimBlendNodeAdditiveFA": 0x41424641,
+    "AnimBlendNodeAdditiveFL": 0x4142464c,
+    "AnimBlendNodeAdditiveI16": 0x41424153,
+    "AnimBlendNodeAdditiveI32": 0x41424149,
+    "AnimBlendNodeAdditiveRotation": 0x41424e52,
+    "AnimBlendNodeAdditiveScale": 0x41424e53,
+    "AnimBlendNodeBoolean": 0x4142424f,
+    "AnimBlendNodeEnum": 0x41424e45,
+    "AnimBlendNodeTime": 0x41425449,
+    "AnimClip": 0x434c504e,
+    "AnimCurveTA": 0x50435441,
+    "AnimCurveTL": 0x5043544c,
+    "AnimCurveTT": 0x50435454,
+    "AnimCurveTU": 0x50435455,
+    "AnimCurveUA": 0x50435541,
+    "AnimCurveUL": 0x5043554c,
+    "AnimCurveUT": 0x50435554,
+    "AnimCurveUU": 0x50435555,
+    "AnimLayer": 0x414e4c52,
+    "Anisotropic": 0x52414e49,
+    "AnnotationShape": 0x414e4e53,
+    "AovChildCollection": 0x5800039c,
+    "AovCollection": 0x5800039b,
+    "ApplyAbs2FloatsOverride": 0x58000397,
+    "ApplyAbs3FloatsOverride": 0x58000381,
+    "ApplyAbsBoolOverride": 0x5800038a,
+    "ApplyAbsEnumOverride": 0x5800038c,
+    "ApplyAbsFloatOverride": 0x5800037d,
+    "ApplyAbsIntOverride": 0x58000391,
+    "ApplyAbsStringOverride": 0x58000393,
+    "ApplyConnectionOverride": 0x58000384,
+    "ApplyRel2FloatsOverride": 0x58000399,
+    "ApplyRel3FloatsOverride": 0x58000383,
+    "ApplyRelFloatOverride": 0x5800037f,
+    "ApplyRelIntOverride": 0x58000392,
+    "ArcLengthDimension": 0x41444d4e,
+    "AreaLight": 0x41524c54,
+    "ArrayMapper": 0x44414d50,
+    "ArrowManip": 0x554d4152,
+    "ArubaTessellate": 0x41544553,
+    "AttachCurve": 0x4e415443,
+    "AttachSurface": 0x4e415453,
+    "AttrHierarchyTest": 0x41544854,
+    "Audio": 0x41554449,
+    "AvgCurves": 0x4e414352,
+    "AvgNurbsSurfacePoints": 0x4e414e50,
+    "AvgSurfacePoints": 0x4e415350,
+    "BallProjManip": 0x554d4250,
+    "BarnDoorManip": 0x554d4c4e,
+    "BaseLattice": 0x46424153,
+    "BasicSelector": 0x58000375,
+    "Bevel": 0x4e42564c,
+    "BevelPlus": 0x4e425356,
+    "BezierCurve": 0x42435256,
+    "BezierCurveToNurbs": 0x42544e52,
+    "BlendColorSets": 0x50424353,
+    "BlendColors": 0x52424c32,
+    "BlendDevice": 0x424c4456,
+    "BlendShape": 0x46424c53,
+    "BlendTwoAttr": 0x41424c32,
+    "BlendWeighted": 0x41424c57,
+    "BlindDataTemplate": 0x424c4454,
+    "Blinn": 0x52424c4e,
+    "BoneLattice": 0x4642554c,
+    "Boolean": 0x4e424f4c,
+    "Boundary": 0x4e424e44,
+    "Brownian": 0x5246424d,
+    "Brush": 0x42525348,
+    "Bulge": 0x52544255,
+    "Bump2d": 0x5242554d,
+    "Bump3d": 0x52425533,
+    "ButtonManip": 0x55465054,
+    "CacheBlend": 0x4354524b,
+    "CacheFile": 0x43434846,
+    "Camera": 0x4443414d,
+    "CameraManip": 0x554d4958,
+    "CameraPlaneManip": 0x554d4350,
+    "CameraSet": 0x44525452,
+    "CameraView": 0x44434156,
+    "CenterManip": 0x434e4d50,
+    "Character": 0x43484152,
+    "CharacterMap": 0x434d4150,
+    "CharacterOffset": 0x584f4646,
+    "Checker": 0x52544348,
+    "Choice": 0x43484345,
+    "Chooser": 0x43484f4f,
+    "CircleManip": 0x554d434c,
+    "CircleSweepManip": 0x5543534d,
+    "Clamp": 0x52434c33,
+    "ClipGhostShape": 0x43475348,
+    "ClipLibrary": 0x434c4950,
+    "ClipScheduler": 0x43534348,
+    "ClipToGhostData": 0x43324744,
+    "CloseCurve": 0x4e434355,
+    "CloseSurface": 0x4e435355,
+    "ClosestPointOnMesh": 0x43504f4d,
+    "ClosestPointOnSurface": 0x4e435053,
+    "Cloth": 0x5254434c,
+    "Cloud": 0x52544344,
+    "Cluster": 0x46434c53,
+    "ClusterFlexorShape": 0x464a4346,
+    "ClusterHandle": 0x46434c48,
+    "CoiManip": 0x55465054,
+    "Collection": 0x58000373,
+    "CollisionModel": 0x59434f4c,
+    "ColorManagementGlobals": 0x434d4742,
+    "ColorProfile": 0x434f4c50,
+    "CombinationShape": 0x46434e53,
+    "CompactPlugArrayTest": 0x43504154,
+    "ComponentManip": 0x5554544d,
+    "ConcentricProjManip": 0x554d434f,
+    "Condition": 0x52434e44,
+    "ConnectionOverride": 0x58000385,
+    "ConnectionUniqueOverride": 0x580003a2,
+    "Container": 0x434f4e54,
+    "ContainerBase": 0x434f4241,
+    "Contrast": 0x52434f4e,
+    "Controller": 0x43475250,
+    "CopyColorSet": 0x43504353,
+    "CopyUVSet": 0x43505553,
+    "CpManip": 0x554d4350,
+    "Crater": 0x52533430,
+    "CreaseSet": 0x43524541,
+    "CreateColorSet": 0x43524353,
+    "CreateUVSet": 0x43525553,
+    "CubicProjManip": 0x554d4355,
+    "CurveFromMeshCoM": 0x4e434d43,
+    "CurveFromMeshEdge": 0x4e434d45,
+    "CurveFromSubdivEdge": 0x53435345,
+    "CurveFromSubdivFace": 0x53435346,
+    "CurveFromSurfaceBnd": 0x4e435342,
+    "CurveFromSurfaceCoS": 0x4e435343,
+    "CurveFromSurfaceIso": 0x4e435349,
+    "CurveInfo": 0x4e43494e,
+    "CurveIntersect": 0x4e434349,
+    "CurveNormalizerAngle": 0x434e5241,
+    "CurveNormalizerLinear": 0x434e524c,
+    "CurveSegmentManip": 0x554d5043,
+    "CurveVarGroup": 0x4e435647,
+    "CylindricalProjManip": 0x554d4359,
+    "DagContainer": 0x44414743,
+    "DagPose": 0x46504f53,
+    "DataBlockTest": 0x44425453,
+    "DefaultLightList": 0x4445464c,
+    "DefaultRenderUtilityList": 0x4452554c,
+    "DefaultRenderingList": 0x44524e4c,
+    "DefaultShaderList": 0x5244534c,
+    "DefaultTextureList": 0x5244544c,
+    "DeformBend": 0x46444244,
+    "DeformFlare": 0x4644464c,
+    "DeformSine": 0x4644534e,
+    "DeformSquash": 0x46445351,
+    "DeformTwist": 0x46445457,
+    "DeformWave": 0x46445756,
+    "DeleteColorSet": 0x444c4353,
+    "DeleteComponent": 0x44454354,
+    "DeleteUVSet": 0x444c4d53,
+    "DeltaMush": 0x444c544d,
+    "DetachCurve": 0x4e445443,
+    "DetachSurface": 0x4e445453,
+    "DirectedDisc": 0x44445343,
+    "DirectionManip": 0x55465054,
+    "DirectionalLight": 0x4449524c,
+    "DiscManip": 0x5544534d,
+    "DiskCache": 0x44534b43,
+    "DisplacementShader": 0x52445348,
+    "DisplayLayer": 0x4453504c,
+    "DisplayLayerManager": 0x44504c4d,
+    "DistanceBetween": 0x44444254,
+    "DistanceDimShape": 0x44444d4e,
+    "DistanceManip": 0x554d444d,
+    "Dof": 0x444f4644,
+    "DofManip": 0x554d4350,
+    "DoubleShadingSwitch": 0x53574832,
+    "DpBirailSrf": 0x4e444253,
+    "DragField": 0x59445247,
+    "DropoffLocator": 0x444c4354,
+    "DynAttenuationManip": 0x554d444d,
+    "DynController": 0x5943544c,
+    "DynGlobals": 0x5944474c,
+    "DynHolder": 0x59484c44,
+    "DynSpreadManip": 0x554d444d,
+    "DynamicConstraint": 0x44434f4e,
+    "EditMetadata": 0x454d5444,
+    "EditsManager": 0x454d4752,
+    "EmitterManip": 0x554d4958,
+    "EnableManip": 0x454e4d50,
+    "EnvBall": 0x5245424c,
+    "EnvChrome": 0x52454348,
+    "EnvCube": 0x52454342,
+    "EnvFacade": 0x52454643,
+    "EnvFog": 0x52454647,
+    "EnvSky": 0x5245534b,
+    "EnvSphere": 0x52455350,
+    "EnvironmentFog": 0x454e5646,
+    "ExplodeNurbsShell": 0x4e455348,
+    "Expression": 0x44455850,
+    "ExtendCurve": 0x4e455843,
+    "ExtendSurface": 0x4e455853,
+    "Extrude": 0x4e455852,
+    "Facade": 0x4446434e,
+    "FfBlendSrf": 0x4e424c54,
+    "FfBlendSrfObsolete": 0x4e424c53,
+    "FfFilletSrf": 0x4e464653,
+    "Ffd": 0x46464644,
+    "FieldManip": 0x554d4958,
+    "FieldsManip": 0x554d4958,
+    "File": 0x52544654,
+    "FilletCurve": 0x4e464352,
+    "FitBspline": 0x4e465443,
+    "FlexorShape": 0x464c5848,
+    "Flow": 0x464c4f57,
+    "FluidEmitter": 0x46454d49,
+    "FluidShape": 0x464c5549,
+    "FluidSliceManip": 0x46534c4d,
+    "FluidTexture2D": 0x464c5454,
+    "FluidTexture3D": 0x464c5458,
+    "Follicle": 0x48435256,
+    "ForceUpdateManip": 0x554d4655,
+    "FosterParent": 0x4650524e,
+    "FourByFourMatrix": 0x4642464d,
+    "Fractal": 0x52543246,
+    "FrameCache": 0x46434348,
+    "FreePointManip": 0x554d4650,
+    "FreePointTriadManip": 0x55465054,
+    "GammaCorrect": 0x5247414d,
+    "GeoConnectable": 0x5947434f,
+    "GeoConnector": 0x59474354,
+    "GeomBind": 0x4742494e,
+    "GeometryConstraint": 0x44474e43,
+    "GeometryFilter": 0x44474649,
+    "GeometryOnLineManip": 0x554d474c,
+    "GeometryVarGroup": 0x4e475647,
+    "GlobalCacheControl": 0x4743434c,
+    "GlobalStitch": 0x4e475354,
+    "Granite": 0x52544752,
+    "GravityField": 0x59475241,
+    "GreasePencilSequence": 0x47505351,
+    "GreasePlane": 0x4447504c,
+    "GreasePlaneRenderShape": 0x47505253,
+    "Grid": 0x52544744,
+    "GroupId": 0x47504944,
+    "GroupParts": 0x47525050,
+    "Guide": 0x46475549,
+    "HairConstraint": 0x4850494e,
+    "HairSystem": 0x48535953,
+    "HairTubeShader": 0x52485442,
+    "HardenPoint": 0x4e484450,
+    "HardwareRenderGlobals": 0x48575247,
+    "HardwareRenderingGlobals": 0x48525247,
+    "HeightField": 0x4f435050,
+    "HierarchyTestNode1": 0x48544e31,
+    "HierarchyTestNode2": 0x48544e32,
+    "HierarchyTestNode3": 0x48544e33,
+    "HikEffector": 0x4446494b,
+    "HikFKJoint": 0x4a54494b,
+    "HikFloorContactMarker": 0x4846434d,
+    "HikGroundPlane": 0x48474e44,
+    "HikHandle": 0x4b484948,
+    "HikIKEffector": 0x494b4546,
+    "HikSolver": 0x4b48494b,
+    "HistorySwitch": 0x48495353,
+    "HoldMatrix": 0x4450484d,
+    "HsvToRgb": 0x52483252,
+    "HwReflectionMap": 0x4857524d,
+    "HwRenderGlobals": 0x59485244,
+    "HyperGraphInfo": 0x48595052,
+    "HyperLayout": 0x4859504c,
+    "HyperView": 0x44485056,
+    "IkEffector": 0x4b454646,
+    "IkHandle": 0x4b48444c,
+    "IkMCsolver": 0x4b4d4353,
+    "IkPASolver": 0x4b504153,
+    "IkRPsolver": 0x4b525053,
+    "IkSCsolver": 0x4b534353,
+    "IkSplineSolver": 0x4b535053,
+    "IkSystem": 0x4b535953,
+    "ImagePlane": 0x4449504c,
+    "ImplicitBox": 0x46494258,
+    "ImplicitCone": 0x4649434f,
+    "ImplicitSphere": 0x46495350,
+    "IndexManip": 0x554d4958,
+    "InsertKnotCurve": 0x4e494b43,
+    "InsertKnotSurface": 0x4e494b53,
+    "Instancer": 0x594e5354,
+    "IntersectSurface": 0x4e495346,
+    "Jiggle": 0x4a474446,
+    "Joint": 0x4a4f494e,
+    "JointCluster": 0x464a434c,
+    "JointFfd": 0x46464442,
+    "JointLattice": 0x4642454c,
+    "KeyframeRegionManip": 0x4b46524d,
+    "KeyingGroup": 0x4b475250,
+    "Lambert": 0x524c414d,
+    "Lattice": 0x464c4154,
+    "LayeredShader": 0x4c595253,
+    "LayeredTexture": 0x4c595254,
+    "LeastSquaresModifier": 0x4e4c534d,
+    "Leather": 0x52544c45,
+    "LightEditor": 0x580003e3,
+    "LightFog": 0x52464f47,
+    "LightGroup": 0x580003e2,
+    "LightInfo": 0x524c494e,
+    "LightItem": 0x580003e1,
+    "LightLinker": 0x524c4c4b,
+    "LightList": 0x4c4c5354,
+    "LightManip": 0x554d4958,
+    "LightsChildCollection": 0x5800039a,
+    "LightsCollection": 0x58000394,
+    "LightsCollectionSelector": 0x580003a4,
+    "LimitManip": 0x4c544d50,
+    "LineManip": 0x554d4c4e,
+    "LineModifier": 0x4c4d4f44,
+    "Locator": 0x4c4f4354,
+    "LodGroup": 0x4c4f4447,
+    "LodThresholds": 0x4c4f4454,
+    "Loft": 0x4e534b4e,
+    "LookAt": 0x444c4154,
+    "Luminance": 0x524c554d,
+    "MakeGroup": 0x504d4752,
+    "MakeIllustratorCurves": 0x4e4d4943,
+    "MakeNurbCircle": 0x4e435243,
+    "MakeNurbCone": 0x4e434e45,
+    "MakeNurbCube": 0x4e435542,
+    "MakeNurbCylinder": 0x4e43594c,
+    "MakeNurbPlane": 0x4e504c4e,
+    "MakeNurbSphere": 0x4e535048,
+    "MakeNurbTorus": 0x4e544f52,
+    "MakeNurbsSquare": 0x4e535152,
+    "MakeTextCurves": 0x4e545843,
+    "MakeThreePointCircularArc": 0x4e334341,
+    "MakeTwoPointCircularArc": 0x4e324341,
+    "Mandelbrot": 0x52544d41,
+    "Mandelbrot3D": 0x52544d33,
+    "Manip2DContainer": 0x554d3243,
+    "ManipContainer": 0x554d4343,
+    "Marble": 0x52544d52,
+    "MarkerManip": 0x554d4d41,
+    "MaterialFacade": 0x524d4643,
+    "MaterialInfo": 0x444d5449,
+    "MaterialOverride": 0x58000387,
+    "Membrane": 0x4d454d42,
+    "Mesh": 0x444d5348,
+    "MeshVarGroup": 0x4e4d5647,
+    "MotionPath": 0x4d505448,
+    "MotionPathManip": 0x554d4d41,
+    "MotionTrail": 0x4d4f5452,
+    "MotionTrailShape": 0x4d4f5348,
+    "Mountain": 0x52544d54,
+    "MoveVertexManip": 0x554d4650,
+    "Movie": 0x52544d56,
+    "MpBirailSrf": 0x4e4d4253,
+    "MultDoubleLinear": 0x444d444c,
+    "MultMatrix": 0x444d544d,
+    "MultilisterLight": 0x4d554c4c,
+    "MultiplyDivide": 0x524d4449,
+    "Mute": 0x4d555445,
+    "NCloth": 0x4e434c4f,
+    "NComponent": 0x4e434d50,
+    "NParticle": 0x4e504152,
+    "NRigid": 0x4e524744,
+    "NearestPointOnCurve": 0x4e504f43,
+    "Network": 0x4e54574b,
+    "NewtonField": 0x594e4557,
+    "NewtonManip": 0x554d4958,
+    "Noise": 0x52544e33,
+    "NonLinear": 0x464e4c44,
+    "NormalConstraint": 0x444e4332,
+    "Nucleus": 0x4e535953,
+    "NurbsCurve": 0x4e435256,
+    "NurbsCurveToBezier": 0x4e525442,
+    "NurbsSurface": 0x4e535246,
+    "NurbsTessellate": 0x4e544553,
+    "NurbsToSubdiv": 0x534e5453,
+    "NurbsToSubdivProc": 0x534e5450,
+    "ObjectAttrFilter": 0x4f464154,
+    "ObjectBinFilter": 0x4f4b464c,
+    "ObjectFilter": 0x4f464c54,
+    "ObjectMultiFilter": 0x4f4d464c,
+    "ObjectNameFilter": 0x4f4e464c,
+    "ObjectRenderFilter": 0x4f52464c,
+    "ObjectScriptFilter": 0x4f53464c,
+    "ObjectSet": 0x4f425354,
+    "ObjectTypeFilter": 0x4f54464c,
+    "Ocean": 0x52544f43,
+    "OceanShader": 0x524f5053,
+    "OffsetCos": 0x4e4f4353,
+    "OffsetCurve": 0x4e4f4355,
+    "OffsetSurface": 0x4e4f5355,
+    "OldBlindDataBase": 0x42444454,
+    "OldGeometryConstraint": 0x44474d43,
+    "OldNormalConstraint": 0x444e5243,
+    "OldTangentConstraint": 0x44544e43,
+    "OpticalFX": 0x4f504658,
+    "OrientConstraint": 0x444f5243,
+    "OrientationMarker": 0x4f52544d,
+    "PairBlend": 0x4150424c,
+    "ParamDimension": 0x52444d4e,
+    "ParentConstraint": 0x44504152,
+    "Particle": 0x59504152,
+    "ParticleAgeMapper": 0x50414d41,
+    "ParticleCloud": 0x50434c44,
+    "ParticleColorMapper": 0x50434d41,
+    "ParticleIncandMapper": 0x50494d41,
+    "ParticleSamplerInfo": 0x5053494e,
+    "ParticleTranspMapper": 0x50544d41,
+    "Partition": 0x5052544e,
+    "PassContributionMap": 0x5053434d,
+    "PassMatrix": 0x4450534d,
+    "PfxHair": 0x50464841,
+    "PfxToon": 0x5046544f,
+    "Phong": 0x5250484f,
+    "PhongE": 0x52504845,
+    "PivotAndOrientManip": 0x50414f4d,
+    "Place2dTexture": 0x52504c32,
+    "Place3dTexture": 0x52504c44,
+    "PlanarProjManip": 0x554d5050,
+    "PlanarTrimSurface": 0x4e504c54,
+    "PlusMinusAverage": 0x52504d41,
+    "PointConstraint": 0x44505443,
+    "PointEmitter": 0x59454d49,
+    "PointLight": 0x504f4954,
+    "PointMatrixMult": 0x44504d4d,
+    "PointOnCurveInfo": 0x4e504349,
+    "PointOnCurveManip": 0x554d5043,
+    "PointOnLineManip": 0x554d504c,
+    "PointOnPolyConstraint": 0x44505043,
+    "PointOnSurfManip": 0x554d5353,
+    "PointOnSurfaceInfo": 0x4e505349,
+    "PointOnSurfaceManip": 0x554d5053,
+    "PoleVectorConstraint": 0x44505643,
+    "PolyAppend": 0x50415050,
+    "PolyAppendVertex": 0x50415056,
+    "PolyAutoProj": 0x50415550,
+    "PolyAverageVertex": 0x50415656,
+    "PolyBevel": 0x5042564c,
+    "PolyBevel2": 0x50425632,
+    "PolyBevel3": 0x50425633,
+    "PolyBlindData": 0x4d424454,
+    "PolyBoolOp": 0x50424f50,
+    "PolyBridgeEdge": 0x50425245,
+    "PolyCBoolOp": 0x50435642,
+    "PolyChipOff": 0x50434849,
+    "PolyCircularize": 0x50435243,
+    "PolyClean": 0x504c434c,
+    "PolyCloseBorder": 0x50434c4f,
+    "PolyCollapseEdge": 0x50434f45,
+    "PolyCollapseF": 0x50434f46,
+    "PolyColorDel": 0x5043444c,
+    "PolyColorMod": 0x50434d4f,
+    "PolyColorPerVertex": 0x50435056,
+    "PolyCone": 0x50434f4e,
+    "PolyConnectComponents": 0x50434353,
+    "PolyContourProj": 0x50434e50,
+    "PolyCopyUV": 0x50435556,
+    "PolyCrease": 0x50435253,
+    "PolyCreaseEdge": 0x50435345,
+    "PolyCreateFace": 0x50435245,
+    "PolyCube": 0x50435542,
+    "PolyCut": 0x50504354,
+    "PolyCylProj": 0x50435950,
+    "PolyCylinder": 0x5043594c,
+    "PolyDelEdge": 0x50444545,
+    "PolyDelFacet": 0x50444546,
+    "PolyDelVertex": 0x50444556,
+    "PolyDuplicateEdge": 0x50445545,
+    "PolyEdgeToCurve": 0x50544356,
+    "PolyEditEdgeFlow": 0x50534546,
+    "PolyExtrudeEdge": 0x50455845,
+    "PolyExtrudeFace": 0x50455846,
+    "PolyExtrudeVertex": 0x50455856,
+    "PolyFlipEdge": 0x50464c45,
+    "PolyFlipUV": 0x50465556,
+    "PolyHelix": 0x48454c49,
+    "PolyHoleFace": 0x50484645,
+    "PolyLayoutUV": 0x504c5556,
+    "PolyMapCut": 0x504d4143,
+    "PolyMapDel": 0x504d4144,
+    "PolyMapSew": 0x504d4153,
+    "PolyMapSewMove": 0x5053454d,
+    "PolyMergeEdge": 0x504d4545,
+    "PolyMergeFace": 0x504d4546,
+    "PolyMergeUV": 0x504d4755,
+    "PolyMergeVert": 0x504d5645,
+    "PolyMirror": 0x504d4952,
+    "PolyMoveEdge": 0x504d4f45,
+    "PolyMoveFace": 0x504d4f46,
+    "PolyMoveFacetUV": 0x504d4655,
+    "PolyMoveUV": 0x504d5556,
+    "PolyMoveVertex": 0x504d4f56,
+    "PolyNormal": 0x504e4f52,
+    "PolyNormalPerVertex": 0x504e5056,
+    "PolyNormalizeUV": 0x504e5556,
+    "PolyOptUvs": 0x504f5556,
+    "PolyPassThru": 0x50595054,
+    "PolyPinUV": 0x50505556,
+    "PolyPipe": 0x50504950,
+    "PolyPlanarProj": 0x50504c50,
+    "PolyPlane": 0x504d4553,
+    "PolyPlatonicSolid": 0x534f4c49,
+    "PolyPoke": 0x5050504b,
+    "PolyPrimitiveMisc": 0x4d495343,
+    "PolyPrism": 0x50505249,
+    "PolyProj": 0x5050524f,
+    "PolyProjectCurve": 0x50504356,
+    "PolyPyramid": 0x50505952,
+    "PolyQuad": 0x50515541,
+    "PolyReduce": 0x50524544,
+    "PolyRemesh": 0x50524d48,
+    "PolyRetopo": 0x5052464d,
+    "PolySeparate": 0x50534550,
+    "PolySewEdge": 0x50535745,
+    "PolySmooth": 0x50534d54,
+    "PolySmoothFace": 0x50534d46,
+    "PolySmoothProxy": 0x50534d50,
+    "PolySoftEdge": 0x50534f45,
+    "PolySphProj": 0x50535050,
+    "PolySphere": 0x50535048,
+    "PolySpinEdge": 0x50535051,
+    "PolySplit": 0x5053504c,
+    "PolySplitEdge": 0x50534544,
+    "PolySplitRing": 0x50535052,
+    "PolySplitVert": 0x50535645,
+    "PolyStraightenUVBorder": 0x50535442,
+    "PolySubdEdge": 0x50535545,
+    "PolySubdFace": 0x50535546,
+    "PolyToSubdiv": 0x50534453,
+    "PolyTorus": 0x50544f52,
+    "PolyTransfer": 0x50544652,
+    "PolyTriangulate": 0x50545249,
+    "PolyTweak": 0x5054574b,
+    "PolyTweakUV": 0x50545556,
+    "PolyUVRectangle": 0x50555652,
+    "PolyUnite": 0x50554e49,
+    "PolyWedgeFace": 0x50574643,
+    "PoseInterpolatorManager": 0x5053444d,
+    "PositionMarker": 0x504f534d,
+    "PostProcessList": 0x50505354,
+    "ProjectCurve": 0x4e504352,
+    "ProjectTangent": 0x4e50544e,
+    "Projection": 0x5250524a,
+    "ProjectionManip": 0x554d4354,
+    "PropModManip": 0x554d4354,
+    "PropMoveTriadManip": 0x554d5054,
+    "ProxyManager": 0x50584d47,
+    "PsdFileTex": 0x50534454,
+    "QuadPtOnLineManip": 0x554d504c,
+    "QuadShadingSwitch": 0x53574834,
+    "RadialField": 0x59524144,
+    "Ramp": 0x52545241,
+    "RampShader": 0x52525053,
+    "RbfSrf": 0x4e524246,
+    "RebuildCurve": 0x4e524243,
+    "RebuildSurface": 0x4e524253,
+    "Record": 0x52454344,
+    "Reference": 0x5245464e,
+    "RelOverride": 0x5800037a,
+    "RelUniqueOverride": 0x580003a1,
+    "RemapColor": 0x524d434c,
+    "RemapHsv": 0x524d4853,
+    "RemapValue": 0x524d564c,
+    "RenderBox": 0x524e4258,
+    "RenderCone": 0x524e434f,
+    "RenderGlobals": 0x52474c42,
+    "RenderGlobalsList": 0x5244474c,
+    "RenderLayer": 0x524e444c,
+    "RenderLayerManager": 0x524e4c4d,
+    "RenderPass": 0x524e5053,
+    "RenderPassSet": 0x52505353,
+    "RenderQuality": 0x52515541,
+    "RenderRect": 0x52524354,
+    "RenderSettingsChildCollection": 0x580003a3,
+    "RenderSettingsCollection": 0x58000395,
+    "RenderSetup": 0x58000371,
+    "RenderSetupLayer": 0x58000372,
+    "RenderSphere": 0x524e5350,
+    "RenderTarget": 0x524e5447,
+    "RenderedImageSource": 0x52434953,
+    "ReorderUVSet": 0x524f5553,
+    "Resolution": 0x524c544e,
+    "ResultCurveTimeToAngular": 0x52435441,
+    "ResultCurveTimeToLinear": 0x5243544c,
+    "ResultCurveTimeToTime": 0x52435454,
+    "ResultCurveTimeToUnitless": 0x52435455,
+    "Reverse": 0x52525653,
+    "ReverseCurve": 0x4e525643,
+    "ReverseSurface": 0x4e525653,
+    "Revolve": 0x4e52564c,
+    "RgbToHsv": 0x52523248,
+    "RigidBody": 0x59524744,
+    "RigidConstraint": 0x59435354,
+    "RigidSolver": 0x59534c56,
+    "Rock": 0x5254524b,
+    "RotateLimitsManip": 0x554d524c,
+    "RotateManip": 0x554d5241,
+    "RotateUV2dManip": 0x5532524f,
+    "RoundConstantRadius": 0x4e524352,
+    "Sampler": 0x46534d50,
+    "SamplerInfo": 0x5253494e,
+    "ScaleConstraint": 0x44534343,
+    "ScaleLimitsManip": 0x4c544d50,
+    "ScaleManip": 0x554d4650,
+    "ScaleUV2dManip": 0x55325343,
+    "ScreenAlignedCircleManip": 0x5341434d,
+    "Script": 0x53435250,
+    "ScriptManip": 0x554d5343,
+    "Sculpt": 0x46534350,
+    "SelectionListOperator": 0x534c4f50,
+    "SequenceManager": 0x53514d47,
+    "Sequencer": 0x53514e43,
+    "SetRange": 0x52524e47,
+    "ShaderGlow": 0x5348474c,
+    "ShaderOverride": 0x58000386,
+    "ShadingEngine": 0x53484144,
+    "ShadingMap": 0x53444d50,
+    "ShapeEditorManager": 0x53444d4c,
+    "ShellTessellate": 0x53544553,
+    "Shot": 0x53484f54,
+    "ShrinkWrap": 0x53575250,
+    "SimpleSelector": 0x5800039e,
+    "SimpleTestNode": 0x53544e44,
+    "SimpleVolumeShader": 0x53565348,
+    "SingleShadingSwitch": 0x53574831,
+    "SketchPlane": 0x534b504e,
+    "SkinBinding": 0x534b4244,
+    "SkinCluster": 0x4653434c,
+    "SmoothCurve": 0x4e534d43,
+    "SmoothTangentSrf": 0x4e53544e,
+    "SnapUV2dManip": 0x5532534e,
+    "Snapshot": 0x534e5054,
+    "SnapshotShape": 0x53534841,
+    "Snow": 0x5254534e,
+    "SoftMod": 0x4653534c,
+    "SoftModHandle": 0x46535348,
+    "SolidFractal": 0x52544633,
+    "SpBirailSrf": 0x4e534253,
+    "SphericalProjManip": 0x554d5350,
+    "SpotCylinderManip": 0x53434d50,
+    "SpotLight": 0x5350544c,
+    "SpotManip": 0x554d4958,
+    "Spring": 0x59535052,
+    "SquareSrf": 0x4e535153,
+    "Stencil": 0x52545354,
+    "StereoRigCamera": 0x53524341,
+    "StitchAsNurbsShell": 0x4e535348,
+    "StitchSrf": 0x4e535453,
+    "Stroke": 0x5354524b,
+    "StrokeGlobals": 0x53544b47,
+    "Stucco": 0x52533630,
+    "StyleCurve": 0x4e535443,
+    "SubCurve": 0x4e534243,
+    "SubSurface": 0x4e535352,
+    "SubdAddTopology": 0x53415459,
+    "SubdAutoProj": 0x53415550,
+    "SubdBlindData": 0x53424454,
+    "SubdCleanTopology": 0x53435459,
+    "SubdHierBlind": 0x53485242,
+    "SubdLayoutUV": 0x534c5556,
+    "SubdMapCut": 0x534d4143,
+    "SubdMapSewMove": 0x5353454d,
+    "SubdPlanarProj": 0x53504c50,
+    "SubdTweak": 0x5354574b,
+    "SubdTweakUV": 0x53545556,
+    "Subdiv": 0x53445353,
+    "SubdivCollapse": 0x53434c50,
+    "SubdivComponentId": 0x53534944,
+    "SubdivReverseFaces": 0x53525646,
+    "SubdivSurfaceVarGroup": 0x53535647,
+    "SubdivToNurbs": 0x5344534e,
+    "SubdivToPoly": 0x53445350,
+    "SurfaceInfo": 0x4e53494e,
+    "SurfaceLuminance": 0x52534c55,
+    "SurfaceShader": 0x52535348,
+    "SurfaceVarGroup": 0x4e535647,
+    "SymmetryConstraint": 0x44534d43,
+    "TangentConstraint": 0x44544332,
+    "Tension": 0x54454e53,
+    "TextButtonManip": 0x554d5442,
+    "Texture3dManip": 0x554d5458,
+    "TextureBakeSet": 0x5442414b,
+    "TextureDeformer": 0x54584446,
+    "TextureDeformerHandle": 0x54444844,
+    "TextureToGeom": 0x5454474f,
+    "Time": 0x54494d45,
+    "TimeEditor": 0x544d4544,
+    "TimeEditorAnimSource": 0x54454153,
+    "TimeEditorClip": 0x41434c43,
+    "TimeEditorClipBase": 0x414c434c,
+    "TimeEditorClipEvaluator": 0x4143524f,
+    "TimeEditorInterpolator": 0x54454950,
+    "TimeEditorTracks": 0x5445544b,
+    "TimeFunction": 0x7466786e,
+    "TimeToUnitConversion": 0x44544d55,
+    "TimeWarp": 0x54495741,
+    "ToggleManip": 0x554d5447,
+    "ToggleOnLineManip": 0x55544f4c,
+    "ToolDrawManip": 0x5454444d,
+    "ToolDrawManip2D": 0x54444d32,
+    "ToonLineAttributes": 0x544c4154,
+    "TrackInfoManager": 0x54494d47,
+    "TransUV2dManip": 0x55325452,
+    "TransferAttributes": 0x54524154,
+    "Transform": 0x5846524d,
+    "TransformGeometry": 0x5447454f,
+    "TranslateLimitsManip": 0x434e4d50,
+    "TranslateManip": 0x554d4650,
+    "TranslateUVManip": 0x554d5556,
+    "Trim": 0x4e54524d,
+    "TrimWithBoundaries": 0x4e545742,
+    "TriplanarProjManip": 0x554d5452,
+    "TripleShadingSwitch": 0x53574833,
+    "TrsInsertManip": 0x554d4354,
+    "TrsManip": 0x5554544d,
+    "TurbulenceField": 0x59545552,
+    "TurbulenceManip": 0x554d4958,
+    "Tweak": 0x464d5054,
+    "UniformField": 0x59554e49,
+    "UnitConversion": 0x44554e54,
+    "UnitToTimeConversion": 0x4455544d,
+    "Unknown": 0x554e4b4e,
+    "UnknownDag": 0x554e4b44,
+    "UnknownTransform": 0x554e4b54,
+    "Untrim": 0x4e555452,
+    "UseBackground": 0x55534247,
+    "Uv2dManip": 0x5556324d,
+    "UvChooser": 0x55564348,
+    "VectorProduct": 0x52564543,
+    "VertexBakeSet": 0x5642414b,
+    "ViewColorManager": 0x5657434d,
+    "VolumeAxisField": 0x59565846,
+    "VolumeFog": 0x52564647,
+    "VolumeLight": 0x564f4c4c,
+    "VolumeNoise": 0x52545633,
+    "VolumeShader": 0x52565348,
+    "VortexField": 0x59564f52,
+    "Water": 0x52545741,
+    "WeightGeometryFilter": 0x44574746,
+    "Wire": 0x46574952,
+    "Wood": 0x52545744,
+    "Wrap": 0x46575250,
+    "WtAddMatrix": 0x4457414d,
+}
+
+
+def __getattr__(name):
+    value = _IDS.get(name)
+
+    if value is None:
+        raise AttributeError(name)
+
+    typeid = om.MTypeId(value)
+    globals()[name] = typeid
+    return typeid
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_IDS))
+
+
+# Module-level __getattr__ requires Python 3.7
+if sys.version_info < (3, 7):
+    globals().update(
+        (name, om.MTypeId(value)) for name, value in _IDS.items()
+    )
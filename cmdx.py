@@ -4,12 +4,11 @@ import re
 import os
 import sys
 import json
+import array
 import time as time_
 import math
 import types
 import logging
-import operator
-import traceback
 import collections
 import contextlib
 from functools import wraps
@@ -171,6 +170,60 @@ class ModifierError(RuntimeError):
         super(ModifierError, self).__init__(message)
 
 
+class _AttributeExistError(ExistError):
+    """Attribute `name` does not exist on `node`
+
+    Formatting the message involves asking Maya for the path of `node`,
+    which is left until the message is actually needed. Most often it
+    isn't, such as when checking for an attribute with try/except.
+
+    """
+
+    def __init__(self, node, name):
+        super(_AttributeExistError, self).__init__(name)
+        self._node = node
+        self._name = name
+
+    def __str__(self):
+        try:
+            return "%s.%s" % (self._node.path(), self._name)
+
+        # The node may have been deleted since
+        except RuntimeError:
+            return self._name
+
+    def __reduce__(self):
+        # Nodes don't pickle, the message does
+        return ExistError, (str(self),)
+
+
+try:
+    _perf_counter_ns = time_.perf_counter_ns
+
+# Python 2.7 - 3.6
+except AttributeError:
+    try:
+        _perf_counter = time_.perf_counter
+    except AttributeError:
+        _perf_counter = time_.clock
+
+    def _perf_counter_ns():
+        return int(_perf_counter() * 10 ** 9)
+
+# Timings are recorded into a fixed-size ring buffer of
+# (function id, nanoseconds) pairs and only formatted on
+# flushTimings(). Once full, the oldest timings are overwritten.
+# Doubles rather than 64-bit integers, which Python 2 lacks.
+TimingsSize = 2 ** 16
+_timings = array.array("d", [0]) * (TimingsSize * 2) if TIMINGS else None
+_timingsCount = [0]
+_timingsTexts = list()  # (func name, text) per function id
+
+
+def _untimed(func):
+    return func
+
+
 def withTiming(text="{func}() {time:.2f} ns"):
     """Append timing information to a function
 
@@ -181,40 +234,67 @@ def withTiming(text="{func}() {time:.2f} ns"):
 
     """
 
-    try:
-        perf_counter = time_.perf_counter
-
-    # Python 2.7
-    except AttributeError:
-        perf_counter = time_.clock
+    if not TIMINGS:
+        # Do not wrap the function.
+        # This yields zero cost to runtime performance
+        return _untimed
 
     def timings_decorator(func):
-        if not TIMINGS:
-            # Do not wrap the function.
-            # This yields zero cost to runtime performance
-            return func
+        func_id = len(_timingsTexts)
+        _timingsTexts.append((func.__name__, text))
 
         @wraps(func)
         def func_wrapper(*args, **kwargs):
-            t0 = perf_counter()
+            t0 = _perf_counter_ns()
 
             try:
                 return func(*args, **kwargs)
             finally:
-                t1 = perf_counter()
-                duration = (t1 - t0) * 10 ** 6  # microseconds
+                duration = _perf_counter_ns() - t0
 
-                Stats.LastTiming = duration
+                Stats.LastTiming = duration / 1000.0  # microseconds
 
-                log.debug(
-                    text.format(func=func.__name__,
-                                time=duration)
-                )
+                index = (_timingsCount[0] % TimingsSize) * 2
+                _timings[index] = func_id
+                _timings[index + 1] = duration
+                _timingsCount[0] += 1
 
         return func_wrapper
     return timings_decorator
 
 
+def flushTimings():
+    """Log and forget timings recorded since the last flush
+
+    Only the last `TimingsSize` timings are kept, older ones are
+    overwritten and never logged.
+
+    Returns:
+        int: Number of timings logged
+
+    """
+
+    if not TIMINGS:
+        return 0
+
+    count = _timingsCount[0]
+    first = max(0, count - TimingsSize)
+
+    for index in range(first, count):
+        index = (index % TimingsSize) * 2
+        name, text = _timingsTexts[int(_timings[index])]
+        duration = _timings[index + 1] / 1000.0  # microseconds
+        log.debug(text.format(func=name, time=duration))
+
+    _timingsCount[0] = 0
+
+    return count - first
+
+
+if ENABLE_PEP8:
+    flush_timings = flushTimings
+
+
 @contextlib.contextmanager
 def _undo_chunk(name):
     try:
@@ -268,6 +348,32 @@ def _camel_to_title(text):
     ).title().replace("  ", " ")
 
 
+def _type_matcher(type):
+    """Return a function matching a function set against `type`
+
+    Arguments:
+        type (str, om.MTypeId, tuple): Type name or id, or several of
+            either. Returns None when there is nothing to match.
+
+    """
+
+    if not type:
+        return None
+
+    if isinstance(type, (tuple, list)):
+        if isinstance(type[0], om.MTypeId):
+            return lambda fn: fn.typeId in type
+
+        # Names are hashable, unlike MTypeId
+        names = frozenset(type)
+        return lambda fn: fn.typeName in names
+
+    if isinstance(type, om.MTypeId):
+        return lambda fn: fn.typeId == type
+
+    return lambda fn: fn.typeName == type
+
+
 def protected(func):
     """Prevent fatal crashes from illegal access to deleted nodes"""
     if ROGUE_MODE:
@@ -278,7 +384,8 @@ def protected(func):
         node = args[0]
         assert isinstance(node, Node), "arg[0] should have been a cmdx.Node"
 
-        if node.destroyed or not _isalive(node._mobject):
+        # Same as _isalive(), with the handle we already have
+        if not node._handle.isValid():
             raise ExistError("Cannot perform operation on deleted node")
 
         return func(*args, **kwargs)
@@ -359,10 +466,16 @@ class _Unit(int):
     def __new__(cls, unit, enum):
         self = super(_Unit, cls).__new__(cls, enum)
         self._unit = unit
+
+        # Hand Maya a plain integer, sparing it the conversion
+        # of an int subclass on every call
+        self._enum = int(enum)
+
         return self
 
-    def __call__(self, enum):
-        return self._unit(enum, self)
+    def __call__(self, value):
+        # Not pooled, as MAngle and friends are mutable
+        return self._unit(value, self._enum)
 
 
 # Angular units
@@ -423,7 +536,74 @@ UiUnit = TimeUiUnit
 _Cached = type("Cached", (object,), {})  # For isinstance(x, _Cached)
 Cached = _Cached()
 
-_data = collections.defaultdict(dict)
+# Static attributes by (type id, attribute name), see Node.findPlug
+_AttributeCache = dict()
+
+
+def _isa_typeid(node, type):
+    return type == node._fn.typeId
+
+
+def _isa_typename(node, type):
+    return type == node._fn.typeName
+
+
+def _isa_any(node, types):
+    return any(node.isA(t) for t in types)
+
+
+def _isa_fn(node, type):
+    return node._mobject.hasFn(type)
+
+
+# Node.isA() handlers by exact type of argument
+_IsAHandlers = {
+    om.MTypeId: _isa_typeid,
+    tuple: _isa_any,
+    list: _isa_any,
+    int: _isa_fn,
+    _Type: _isa_fn,
+}
+
+for _string_type in string_types:
+    _IsAHandlers[_string_type] = _isa_typename
+
+del _string_type
+
+
+_Double3Types = (om.MFn.kAttribute3Double, om.MFn.kAttribute3Float)
+
+
+def _write_double3(node, key, value):
+    """Write 3 numbers to a double3 or float3 attribute, like translate
+
+    Returns:
+        bool: Whether the value was written, False if unsupported
+
+    """
+
+    for v in value:
+        if type(v) not in (float, int):
+            return False
+
+    mplug = node.findPlug(key, safe=False)
+
+    if mplug.isArray or mplug.attribute().apiType() not in _Double3Types:
+        return False
+
+    mplug.child(0).setDouble(value[0])
+    mplug.child(1).setDouble(value[1])
+    mplug.child(2).setDouble(value[2])
+
+    return True
+
+
+# Plain integers, for lookup-free use in Singleton
+_kDagContainer = om.MFn.kDagContainer
+_kContainer = om.MFn.kContainer
+_kDagNode = om.MFn.kDagNode
+_kSet = om.MFn.kSet
+_kAnimCurve = om.MFn.kAnimCurve
 
 
 class Singleton(type):
@@ -454,45 +634,45 @@ class Singleton(type):
 
     @withTiming()
     def __call__(cls, mobject, exists=True, modifier=None):
-        handle = om.MObjectHandle(mobject)
-        hsh = handle.hashCode()
-        hx = "%x" % hsh
+        hsh = om.MObjectHandle(mobject).hashCode()
 
-        if exists and handle.isValid():
-            try:
-                node = cls._instances[hx]
-                assert not node._destroyed
+        node = cls._instances.get(hsh)
 
-            except KeyError:
-                pass
+        if node is not None:
+            if node._destroyed:
+                # He's dead Jim, and the hashCode
+                # is now free to be used by another node
+                cls._instances.pop(hsh)
+                node = None
 
-            except AssertionError:
-                # He's dead Jim
-                cls._instances.pop(hx)
-
-            else:
+            elif exists:
                 Stats.NodeReuseCount += 1
                 return node
 
         # It hasn't been instantiated before, let's do that.
         # But first, make sure we instantiate the right type
-        if mobject.hasFn(om.MFn.kDagContainer):
+        if mobject.hasFn(_kDagContainer):
             sup = ContainerNode
-        elif mobject.hasFn(om.MFn.kContainer):
+        elif mobject.hasFn(_kContainer):
             sup = ContainerNode
-        elif mobject.hasFn(om.MFn.kDagNode):
+        elif mobject.hasFn(_kDagNode):
             sup = DagNode
-        elif mobject.hasFn(om.MFn.kSet):
+        elif mobject.hasFn(_kSet):
             sup = ObjectSet
-        elif mobject.hasFn(om.MFn.kAnimCurve):
+        elif mobject.hasFn(_kAnimCurve):
             sup = AnimCurve
         else:
             sup = Node
 
         self = super(Singleton, sup).__call__(mobject, exists)
         self._hashCode = hsh
-        self._hexStr = hx
-        cls._instances[hx] = self
+
+        if node is not None:
+            # Re-wrapping a live node, e.g. one handed to
+            # us by a plug-in's postConstructor, keeps its data
+            self._data = node._data
+
+        cls._instances[hsh] = self
         return self
 
 
@@ -520,8 +700,16 @@ class Node(object):
 
     _Fn = om.MFnDependencyNode
 
-    # Module-level cache of previously created instances of Node
-    _Cache = dict()
+    # Fixed layout, rather than a __dict__ per instance
+    __slots__ = (
+        "_mobject",
+        "_handle",
+        "_hashCode",
+        "_hexStr",
+        "_values",
+        "_data",
+        "__weakref__",
+    )
 
     def __eq__(self, other):
         """MObject supports this operator explicitly"""
@@ -589,22 +777,27 @@ class Node(object):
 
         """
 
+        # Fast path for the most common case, node["attr"]
+        if type(key) is str:
+            return Plug(self, self.findPlug(key, safe=False), key=key)
+
         unit = None
         cached = False
         if isinstance(key, (list, tuple)):
             key, items = key[0], key[1:]
 
             for item in items:
-                if isinstance(item, _Unit):
-                    unit = item
-                elif isinstance(item, int):
+                # Including _Unit, being a subclass of int
+                if isinstance(item, int):
                     unit = item
                 elif isinstance(item, _Cached):
                     cached = True
 
-        if cached:
+        if cached and self._values is not None:
             try:
-                return CachedPlug(self._state["values"][key, unit])
+                return CachedPlug(
+                    self._values[key if unit is None else (key, unit)]
+                )
             except KeyError:
                 pass
 
@@ -612,11 +805,7 @@ class Node(object):
             "%s was not the name of an attribute" % key
         )
 
-        try:
-            plug = self.findPlug(key)
-        except RuntimeError:
-            raise ExistError("%s.%s" % (self.path(), key))
-
+        plug = self.findPlug(key, safe=False)
         return Plug(self, plug, unit=unit, key=key)
 
     def __setitem__(self, key, value):
@@ -664,6 +853,11 @@ class Node(object):
 
         """
 
+        # Fast path for e.g. node["translate"] = (1, 2, 3)
+        if type(key) is str and type(value) in (tuple, list):
+            if len(value) == 3 and _write_double3(self, key, value):
+                return
+
         if isinstance(value, Plug):
             value = value.read()
 
@@ -692,7 +886,7 @@ class Node(object):
                         # where this exception is thrown. Stay catious.
                         raise ExistError(key)
 
-        plug = self.findPlug(key)
+        plug = self.findPlug(key, safe=False)
         plug = Plug(self, plug, unit=unit)
 
         # Else, write it immediately
@@ -712,54 +906,31 @@ class Node(object):
         Private members:
             mobject (om.MObject): Wrap this MObject
             fn (om.MFnDependencyNode): The corresponding function set
-            destroyed (bool): Has this node been destroyed by Maya?
-            state (dict): Optional state for performance
+            handle (om.MObjectHandle): Tracks validity of `mobject`
+            values (dict): Previously read values, for performance.
+                Created on first read, as many nodes are never read.
+            data (dict): User data, see :attr:`Node.data`.
+                Created on first access, and lives as long as the node.
 
         """
 
         self._mobject = mobject
-        self._destroyed = False
         self._hashCode = None
-        self._state = {
-            "values": dict(),
-            "callbacks": list()
-        }
+        self._hexStr = None
+        self._values = None
+        self._data = None
 
-        # There is no humanly possible way of knowing when
-        # an MObject is destroyed, other than to listen for
-        # it via a callback. Please correct me if I'm wrong,
-        # callbacks are death.
-        self._state["callbacks"] += [
-            # Monitor node deletion, to prevent accidental
-            # use of MObject past its lifetime which may
-            # result in a fatal crash.
-            om.MNodeMessage.addNodeDestroyedCallback(
-                mobject,
-                self._onDestroyed,  # func
-                None  # clientData
-            )
-        ]
+        # Monitor node destruction, to prevent accidental
+        # use of MObject past its lifetime which may
+        # result in a fatal crash. A handle tracks this
+        # for us, without registering a callback per node.
+        self._handle = om.MObjectHandle(mobject)
 
         Stats.NodeInitCount += 1
 
-    def __del__(self):
-        """Clean up callbacks on garbage collection
-
-        These may/should clean up themselves alongside node
-        destruction, but in case they don't we make extra sure.
-
-        """
-
-        for callback in self._state["callbacks"]:
-            try:
-                om.MMessage.removeCallback(callback)
-            except RuntimeError:
-                pass
-
-        self._state["callbacks"].clear()
-
-    def _onDestroyed(self, mobject, _=None):
-        self._destroyed = True
+    @property
+    def _destroyed(self):
+        return not self._handle.isValid()
 
     @property
     def _fn(self):
@@ -791,11 +962,15 @@ class Node(object):
         Normally, the initialisation of data could happen in the __init__,
         but for some reason the postConstructor of a custom plug-in calls
         __init__ twice for every unique hex, which causes any data added
-        there to be wiped out once the postConstructor is done.
+        there to be wiped out once the postConstructor is done. Hence
+        the data of a live node is passed on to any new instance of it.
 
         """
 
-        return _data[self.hex]
+        if self._data is None:
+            self._data = {}
+
+        return self._data
 
     @property
     def exists(self):
@@ -846,6 +1021,10 @@ class Node(object):
 
         """
 
+        # Only formatted on demand, nodes are keyed by hashCode
+        if self._hexStr is None:
+            self._hexStr = "%x" % self._hashCode
+
         return self._hexStr
 
     # Alias
@@ -889,6 +1068,12 @@ class Node(object):
 
         """
 
+        # Exact types, e.g. MTypeId, str and kTransform
+        handler = _IsAHandlers.get(type.__class__)
+        if handler is not None:
+            return handler(self, type)
+
+        # Subclasses thereof
         if isinstance(type, om.MTypeId):
             return type == self._fn.typeId
         elif isinstance(type, string_types):
@@ -951,10 +1136,11 @@ class Node(object):
                 throw an exception. Default to False, which
                 means it will run Maya's findPlug() and cache
                 the result.
-            safe (bool, optional): (DEPRECATED) Always find the plug through
-                Maya's API, defaults to True. This will not perform
-                any caching and is intended for use during debugging
-                to spot whether caching is causing trouble.
+            safe (bool, optional): Always find the plug by name,
+                defaults to True. This will not perform any caching
+                and is intended for use during debugging to spot
+                whether caching is causing trouble. Always on in
+                SAFE_MODE.
 
         Example:
             >>> node = createNode("transform")
@@ -973,14 +1159,38 @@ class Node(object):
         if not _isalive(self._mobject):
             raise ExistError
 
+        fn = self._fn
+        safe = safe or SAFE_MODE
+
+        # We always want a non-networked plug. It's safer and as-fast.
+        # https://forums.autodesk.com/t5/maya-programming/maya-api-what-is-a-networked-plug-and-do-i-want-it-or-not/td-p/7182472
+        want_networked_plug = False
+
+        # Static attributes are shared by all nodes of a type, and
+        # finding a plug by attribute is faster than by name
+        if not safe:
+            key = (fn.typeId.id(), name)
+            handle = _AttributeCache.get(key)
+
+            # Invalid once e.g. a plug-in is unloaded
+            if handle is not None and handle.isValid():
+                return fn.findPlug(handle.object(), want_networked_plug)
+
         try:
-            # We always want a non-networked plug. It's safer and as-fast.
-            # https://forums.autodesk.com/t5/maya-programming/maya-api-what-is-a-networked-plug-and-do-i-want-it-or-not/td-p/7182472
-            want_networked_plug = False
-            plug = self._fn.findPlug(name, want_networked_plug)
+            plug = fn.findPlug(name, want_networked_plug)
 
         except RuntimeError:
-            raise ExistError("%s.%s" % (self.path(), name))
+            raise _AttributeExistError(self, name)
+
+        if not safe and not plug.isElement:
+            attr = plug.attribute()
+            fnattr = om.MFnAttribute(attr)
+
+            # Dynamic attributes are unique to each node, and an
+            # alias is unique to a node and may point to an element
+            if not fnattr.dynamic and name in (fnattr.name,
+                                               fnattr.shortName):
+                _AttributeCache[key] = om.MObjectHandle(attr)
 
         return plug
 
@@ -1036,9 +1246,8 @@ class Node(object):
 
         """
 
-        self._state["values"].clear()
+        self._values = None
 
-    @protected
     def name(self, namespace=False):
         """Return the name of this node
 
@@ -1053,10 +1262,17 @@ class Node(object):
 
         """
 
-        if namespace:
-            return self._fn.name()
-        else:
-            return self._fn.name().rsplit(":", 1)[-1]
+        # Inlined @protected, this is called an awful lot
+        if not ROGUE_MODE and not self._handle.isValid():
+            raise ExistError("Cannot perform operation on deleted node")
+
+        name = self._fn.name()
+
+        # Most nodes have no namespace to strip
+        if namespace or ":" not in name:
+            return name
+
+        return name.rsplit(":", 1)[-1]
 
     def namespace(self):
         """Get namespace of node
@@ -1121,14 +1337,28 @@ class Node(object):
 
         """
 
+        fn = self._fn
+        layout = _dump_layout(fn)
+
         attrs = collections.OrderedDict() if preserve_order else {}
-        count = self._fn.attributeCount()
+        count = fn.attributeCount()
         for index in range(count):
-            obj = self._fn.attribute(index)
-            plug = self._fn.findPlug(obj, False)
+            obj = fn.attribute(index)
+            plug = fn.findPlug(obj, False)
+
+            if index < len(layout):
+                name, reader = layout[index]
+            else:
+                # Dynamic attributes vary from node to node
+                name, reader = _dump_entry(obj, plug)
 
             try:
-                value = Plug(self, plug).read()
+                # Read simple values straight off of the MPlug,
+                # without the overhead of a Plug per attribute
+                if reader is not None:
+                    value = reader(plug)
+                else:
+                    value = Plug(self, plug).read()
             except (RuntimeError, TypeError):
                 # TODO: Support more types of attributes,
                 # such that this doesn't need to happen.
@@ -1137,7 +1367,7 @@ class Node(object):
                 if not ignore_error:
                     raise
 
-            attrs[plug.name().split(".", 1)[-1]] = value
+            attrs[name] = value
 
         return attrs
 
@@ -1326,8 +1556,18 @@ class Node(object):
 
         """
 
-        for plug in self._fn.getConnections():
-            plug = Plug(self, plug, unit)
+        for mplug in self._fn.getConnections():
+            if not plugs:
+                # Only nodes are returned, no Plug is needed
+                for other in mplug.connectedTo(source, destination):
+                    node = Node(other.node())
+
+                    if type is None or node.isA(type):
+                        yield (node, self) if connections else node
+
+                continue
+
+            plug = Plug(self, mplug, unit)
             for connection in plug.connections(type=type,
                                                unit=unit,
                                                plugs=plugs,
@@ -1335,7 +1575,7 @@ class Node(object):
                                                destination=destination):
 
                 if connections:
-                    yield connection, plug if plugs else self
+                    yield connection, plug
                 else:
                     yield connection
 
@@ -1410,9 +1650,19 @@ class Node(object):
                              connections=connection), None)
 
     def rename(self, name):
-        mod = om.MDGModifier()
-        mod.renameNode(self._mobject, name)
-        mod.doIt()
+        """Rename node to `name`
+
+        Example:
+            >>> node = createNode("transform", name="before")
+            >>> node.rename("after")
+            >>> node.name() == "after"
+            True
+
+        """
+
+        # A modifier per call is overkill for a single, immediate
+        # rename, and one kept around would accumulate every rename
+        self._fn.setName(name)
 
     if ENABLE_PEP8:
         is_alive = isAlive
@@ -1483,6 +1733,8 @@ if __maya_version__ >= 2017:
 
         _Fn = om.MFnContainerNode
 
+        __slots__ = ()
+
         def __getitem__(self, key):
             try:
                 return super(ContainerNode, self).__getitem__(key)
@@ -1534,6 +1786,9 @@ class DagNode(Node):
 
     _Fn = om.MFnDagNode
 
+    # No attributes beyond those of Node
+    __slots__ = ()
+
     def __str__(self):
         return self.path()
 
@@ -1588,7 +1843,6 @@ class DagNode(Node):
         # if you want to use its functions which require sWorld
         return om.MFnTransform(self._mobject)
 
-    @protected
     def path(self):
         """Return full path to node
 
@@ -1602,6 +1856,10 @@ class DagNode(Node):
 
         """
 
+        # Inlined @protected, this is called an awful lot
+        if not ROGUE_MODE and not self._handle.isValid():
+            raise ExistError("Cannot perform operation on deleted node")
+
         return self._fn.fullPathName()
 
     @protected
@@ -1655,7 +1913,7 @@ class DagNode(Node):
 
         """
 
-        return self.path().count("|") - 1
+        return self._fn.getPath().length() - 1
 
     @property
     def boundingBox(self):
@@ -1679,9 +1937,42 @@ class DagNode(Node):
         Arguments:
             type (str): Same as to .children(type=)
 
+        Example:
+            >>> parent = createNode("transform")
+            >>> _ = createNode("transform", parent=parent)
+            >>> _ = createNode("mesh", parent=parent)
+            >>> parent.childCount()
+            1
+            >>> parent.childCount(type="mesh")
+            0
+
         """
 
-        return len(list(self.children(type=type)))
+        if type is not None:
+            return sum(1 for _ in self.children(type=type))
+
+        # Shapes have no children, same as children()
+        if self.isA(kShape):
+            return 0
+
+        # Count without wrapping each child in a DagNode
+        child = self._fn.child
+        count = 0
+
+        for index in range(self._fn.childCount()):
+            try:
+                mobject = child(index)
+            except RuntimeError:
+                # Same as in children()
+                log.warning(
+                    "Child %d of %s not found, this is a bug" % (index, self)
+                )
+                raise
+
+            if mobject.hasFn(om.MFn.kTransform):
+                count += 1
+
+        return count
 
     def addChild(self, child, index=Last, safe=True):
         """Add `child` to self
@@ -1723,12 +2014,13 @@ class DagNode(Node):
         """
 
         path = self._fn.getPath()
+        depth = path.length()
 
-        root = None
-        for level in range(path.length() - 1):
-            root = path.pop()
+        if depth < 2:
+            return self
 
-        return self.__class__(root.node()) if root else self
+        # Pop every level but the top-most in one go
+        return self.__class__(path.pop(depth - 1).node())
 
     def transform(self, space=sObject, time=None):
         """Return TransformationMatrix"""
@@ -1936,12 +2228,11 @@ class DagNode(Node):
         if self.isA(kShape):
             return
 
-        Fn = self._fn.__class__
-        op = operator.eq
-        if isinstance(type, (tuple, list)):
-            op = operator.contains
+        match = _type_matcher(type)
 
-        other = "typeId" if isinstance(type, om.MTypeId) else "typeName"
+        # Types are read through one function set, reused for every child
+        fn = om.MFnDependencyNode()
+        child = self._fn.child
 
         assert self._fn.hasObj(self._mobject), "This is a Maya bug"
 
@@ -1956,7 +2247,7 @@ class DagNode(Node):
 
         for index in range(count):
             try:
-                mobject = self._fn.child(index)
+                mobject = child(index)
 
             except RuntimeError:
                 # TODO: Unsure of exactly when this happens
@@ -1968,24 +2259,29 @@ class DagNode(Node):
             if filter is not None and not mobject.hasFn(filter):
                 continue
 
-            if not type or op(type, getattr(Fn(mobject), other)):
-                node = DagNode(mobject)
+            if match is not None or query is not None:
+                fn.setObject(mobject)
+
+            if match is not None and not match(fn):
+                continue
 
-                if not contains or node.shape(type=contains):
-                    if query is None:
-                        yield node
+            # Check for attributes ahead of reading them, and
+            # ahead of wrapping a child that doesn't have them
+            if query is not None and not all(
+                    fn.hasAttribute(key) for key in query):
+                continue
 
-                    elif isinstance(query, dict):
-                        try:
-                            if all(node[key] == value
-                                   for key, value in query.items()):
-                                yield node
-                        except ExistError:
-                            continue
+            node = DagNode(mobject)
 
-                    else:
-                        if all(key in node for key in query):
-                            yield node
+            if contains and not node.shape(type=contains):
+                continue
+
+            if isinstance(query, dict):
+                if not all(node[key] == value
+                           for key, value in query.items()):
+                    continue
+
+            yield node
 
     def child(self,
               type=None,
@@ -2005,7 +2301,8 @@ class DagNode(Node):
 
         if parent is not None:
             for child in parent.children(type=type, filter=filter):
-                if child != self:
+                # Both are nodes, spare us the generic __ne__
+                if child._mobject != self._mobject:
                     yield child
 
     def sibling(self, type=None, filter=None):
@@ -2034,13 +2331,7 @@ class DagNode(Node):
 
             """
 
-            type = type or om.MFn.kInvalid
-            typeName = None
-
-            # Support filtering by typeName
-            if isinstance(type, string_types):
-                typeName = type
-                type = om.MFn.kInvalid
+            match = _type_matcher(type)
 
             it = om.MItDag(om.MItDag.kDepthFirst, om.MFn.kInvalid)
             it.reset(
@@ -2051,22 +2342,27 @@ class DagNode(Node):
 
             it.next()  # Skip self
 
+            # Read types through one function set, reused for
+            # every node, and only wrap nodes that match
+            fn = om.MFnDependencyNode()
+
             while not it.isDone():
                 mobj = it.currentItem()
-                node = DagNode(mobj)
 
-                if typeName is None:
-                    if not type or type == node._fn.typeId:
-                        yield node
+                if match is None:
+                    yield DagNode(mobj)
+
                 else:
-                    if not typeName or typeName == node._fn.typeName:
-                        yield node
+                    fn.setObject(mobj)
+
+                    if match(fn):
+                        yield DagNode(mobj)
 
                 it.next()
 
     else:
         def descendents(self, type=None):
-            """Recursive, depth-first search; compliant with MItDag of 2017+
+            """Depth-first search; compliant with MItDag of 2017+
 
             Example:
                 >>> grandparent = createNode("transform")
@@ -2083,29 +2379,23 @@ class DagNode(Node):
 
             """
 
-            def _descendents(node, children=None):
-                children = children or list()
-                children.append(node)
-                for child in node.children(filter=None):
-                    _descendents(child, children)
+            match = _type_matcher(type)
 
-                return children
+            # Walk with a stack rather than recursion, yielding
+            # as we go. Children are pushed in reverse, such that
+            # they are popped in the order MItDag would visit them
+            stack = list(self.children(filter=None))
+            stack.reverse()
 
-            # Support filtering by typeName
-            typeName = None
-            if isinstance(type, str):
-                typeName = type
-                type = om.MFn.kInvalid
+            while stack:
+                child = stack.pop()
 
-            descendents = _descendents(self)[1:]  # Skip self
+                if match is None or match(child._fn):
+                    yield child
 
-            for child in descendents:
-                if typeName is None:
-                    if not type or type == child._fn.typeId:
-                        yield child
-                else:
-                    if not typeName or typeName == child._fn.typeName:
-                        yield child
+                grandchildren = list(child.children(filter=None))
+                grandchildren.reverse()
+                stack.extend(grandchildren)
 
     def descendent(self, type=om.MFn.kInvalid):
         """Singular version of :func:`descendents()`
@@ -2243,6 +2533,8 @@ class ObjectSet(Node):
 
     """
 
+    __slots__ = ()
+
     @protected
     def shortestPath(self):
         return self.name(namespace=True)
@@ -2279,10 +2571,11 @@ class ObjectSet(Node):
         """Add several `members` to set
 
         Arguments:
-            members (list): Series of cmdx.Node instances
+            members (list): Series of cmdx.Node instances or names
 
         """
 
+        # All at once, through cmds for undo
         cmds.sets(list(map(str, members)), forceElement=self.path())
 
     def clear(self):
@@ -2312,13 +2605,29 @@ class ObjectSet(Node):
         return next(self.descendents(type), None)
 
     def descendents(self, type=None):
-        """Return hierarchy of objects in set"""
+        """Return hierarchy of objects in set
+
+        Each object is returned once, even if it is both a member
+        and the descendent of another member.
+
+        """
+
+        seen = set()
+
         for member in self.members(type=type):
+
+            # Found under an earlier member, along with its descendents
+            if member.hashCode in seen:
+                continue
+
+            seen.add(member.hashCode)
             yield member
 
             try:
                 for child in member.descendents(type=type):
-                    yield child
+                    if child.hashCode not in seen:
+                        seen.add(child.hashCode)
+                        yield child
 
             except AttributeError:
                 continue
@@ -2350,18 +2659,28 @@ class ObjectSet(Node):
 
         members = set()
 
-        def recurse(objset):
+        # Each set is visited once, even when nested
+        # in several others, or in a cycle of sets
+        visited = set()
+        stack = [self]
+
+        while stack:
+            objset = stack.pop()
+
+            if objset.hashCode in visited:
+                continue
+
+            visited.add(objset.hashCode)
+
             for member in objset:
                 if member.isA(om.MFn.kSet):
-                    recurse(member)
+                    stack.append(member)
                 elif type is not None:
                     if type == member.typeName:
                         members.add(member)
                 else:
                     members.add(member)
 
-        recurse(self)
-
         return list(members)
 
     def member(self, type=None):
@@ -2369,24 +2688,43 @@ class ObjectSet(Node):
 
         return next(self.members(type), None)
 
-    def members(self, type=None):
-        op = operator.eq
-        other = "typeId"
+    # Module-level expression; this isn't evaluated
+    # at run-time, for that extra performance boost.
+    if hasattr(om, "MFnSet"):
+        def members(self, type=None):
+            match = _type_matcher(type)
 
-        if isinstance(type, string_types):
-            other = "typeName"
+            # Types are read through one function set, reused for
+            # every member, and only members that match are wrapped
+            fn = om.MFnDependencyNode()
+            selectionList = om.MFnSet(self._mobject).getMembers(False)
 
-        if isinstance(type, (tuple, list)):
-            op = operator.contains
+            for index in range(selectionList.length()):
+                mobj = selectionList.getDependNode(index)
 
-        for node in cmds.sets(self.name(namespace=True), query=True) or []:
-            node = encode(node)
+                if match is not None:
+                    fn.setObject(mobj)
+
+                    if not match(fn):
+                        continue
+
+                yield Node(mobj)
+
+    else:
+        def members(self, type=None):
+            match = _type_matcher(type)
 
-            if not type or op(type, getattr(node._fn, other)):
-                yield node
+            for node in cmds.sets(self.name(namespace=True),
+                                  query=True) or []:
+                node = encode(node)
+
+                if match is None or match(node._fn):
+                    yield node
 
 
 class AnimCurve(Node):
+    __slots__ = ("_fna",)
+
     if __maya_version__ >= 2016:
         def __init__(self, mobj, exists=True):
             super(AnimCurve, self).__init__(mobj, exists)
@@ -2404,10 +2742,13 @@ class AnimCurve(Node):
                 self._fna.addKey(time, value, tangents, tangents)
 
         def keys(self, times, values, tangents=None, change=None):
-            times = list(map(
-                lambda t: Seconds(t) if isinstance(t, (float, int)) else t,
-                times
-            ))
+            # Called with many keys at a time, so make
+            # each MTime directly rather than via Seconds()
+            MTime, seconds = om.MTime, Seconds._enum
+            times = [
+                MTime(t, seconds) if isinstance(t, (float, int)) else t
+                for t in times
+            ]
 
             if tangents is None:
                 tangents = oma.MFnAnimCurve.kTangentGlobal
@@ -2448,6 +2789,16 @@ class AnimCurve(Node):
 
 
 class Plug(object):
+    # Fixed layout, plugs are created in great numbers
+    __slots__ = (
+        "_node",
+        "_mplug",
+        "_unit",
+        "_cached",
+        "_key",
+        "__weakref__",
+    )
+
     def __abs__(self):
         """Return absolute value of plug
 
@@ -2521,14 +2872,31 @@ class Plug(object):
         """
 
         if isinstance(other, Plug):
+            # The same plug read in the same unit is bound
+            # to have the same value. CachedPlug has no _mplug
+            if self._samePlug(other):
+                return True
+
             other = other.read()
         return self.read() == other
 
     def __ne__(self, other):
         if isinstance(other, Plug):
+            if self._samePlug(other):
+                return False
+
             other = other.read()
         return self.read() != other
 
+    def _samePlug(self, other):
+        """Is `other` the very same plug as this one, in the same unit?"""
+        return (
+            type(self) is Plug and
+            type(other) is Plug and
+            self._unit == other._unit and
+            self._mplug == other._mplug
+        )
+
     def __lt__(self, other):
         """Is plug less than `other`?
 
@@ -2622,12 +2990,15 @@ class Plug(object):
         """
 
         if isinstance(other, str):
-            try:
-                # E.g. node["t"] + "x"
-                return self._node[self.name(long=False) + other]
-            except ExistError:
+            # E.g. node["t"] + "x"
+            name = self.name(long=False) + other
+
+            # Ask first, rather than raise and catch an ExistError
+            if not self._node._fn.hasAttribute(name):
                 # E.g. node["translate"] + "X"
-                return self._node[self.name(long=True) + other]
+                name = self.name(long=True) + other
+
+            return self._node[name]
 
         raise TypeError(
             "unsupported operand type(s) for +: 'Plug' and '%s'"
@@ -2661,8 +3032,7 @@ class Plug(object):
         """
 
         if isinstance(other, (tuple, list)):
-            for entry in other:
-                self.append(entry)
+            self.extend(other)
         else:
             self.append(other)
 
@@ -2763,12 +3133,21 @@ class Plug(object):
             # `evaluateNumElements` then it'll return a single number
             # we could use to `range()` from, but that would only work
             # if the indices were contiguous.
+            #
+            # Elements are made here rather than via self[index],
+            # sparing us its checks for every element
+            cls, node, unit = self.__class__, self._node, self._unit
+            element = self._mplug.elementByLogicalIndex
+
             for index in self._mplug.getExistingArrayAttributeIndices():
-                yield self[index]
+                yield cls(node, element(index), unit)
 
         elif self._mplug.isCompound:
+            cls, node, unit = self.__class__, self._node, self._unit
+            child = self._mplug.child
+
             for index in range(self._mplug.numChildren()):
-                yield self[index]
+                yield cls(node, child(index), unit)
 
         else:
             values = self.read()
@@ -2798,6 +3177,12 @@ class Plug(object):
             >>> node["translate"][2].read()
             5.1
 
+            # Children of compound attributes by name
+            >>> node["translate"]["translateZ"].read()
+            5.1
+            >>> node["translate"]["tz"].read()
+            5.1
+
             # Elements are accessed by logical index, rather than physical
             >>> tm = createNode("transform")
             >>> mult = createNode("multMatrix")
@@ -2846,15 +3231,17 @@ class Plug(object):
 
         elif isinstance(logicalIndex, string_types):
             # Compound attributes have no equivalent
-            # to "MDependencyNode.findPlug()" and must
-            # be searched by hand.
+            # to "MDependencyNode.findPlug()", but the node
+            # knows its attributes by name and the plug can
+            # find the child of any one of them.
             if self._mplug.isCompound:
-                for child in range(self._mplug.numChildren()):
-                    child = self._mplug.child(child)
-                    _, name = child.name().rsplit(".", 1)
+                fn = self._node._fn
+                if fn.hasAttribute(logicalIndex):
+                    attr = fn.attribute(logicalIndex)
+                    parent = om.MFnAttribute(attr).parent
 
-                    if logicalIndex == name:
-                        return cls(self._node, child)
+                    if parent == self._mplug.attribute():
+                        return cls(self._node, self._mplug.child(attr))
 
             else:
                 raise TypeError("'%s' is not a compound attribute"
@@ -2893,7 +3280,8 @@ class Plug(object):
 
         """
 
-        assert isinstance(node, Node), "%s is not a Node" % node
+        if SAFE_MODE:
+            assert isinstance(node, Node), "%s is not a Node" % node
 
         self._node = node
         self._mplug = mplug
@@ -3169,16 +3557,16 @@ class Plug(object):
 
         """
 
-        # Assume a max of 10 million connections
-        max_index = 1e7
+        # Only existing elements can be connected, anything
+        # past those is available without having to look
+        existing = set(self._mplug.getExistingArrayAttributeIndices())
+        element = self._mplug.elementByLogicalIndex
 
-        while startIndex < max_index:
-            if self[startIndex].connection() is None:
-                return startIndex
-            startIndex += 1
+        index = startIndex
+        while index in existing and element(index).isConnected:
+            index += 1
 
-        # No connections means the first index is available
-        return 0
+        return index
 
     def pull(self):
         """Pull on a plug, without serialising any value. For performance."""
@@ -3259,8 +3647,19 @@ class Plug(object):
 
         """
 
+        if not self._mplug.isArray:
+            raise TypeError("\"%s\" was not an array attribute" % self.path())
+
+        # Count once, rather than once per value via append()
+        index = self.count()
+
         for value in values:
-            self.append(value)
+            if isinstance(value, Plug):
+                self[index] << value
+            else:
+                self[index].write(value)
+
+            index += 1
 
     def count(self):
         return self._mplug.evaluateNumElements()
@@ -3328,24 +3727,59 @@ class Plug(object):
     asTm = asTransformationMatrix
     asTransform = asTransformationMatrix
 
+    def _read3(self, time=None):
+        """Read a plug with 3 children, like translate or rotate
+
+        Children are read as doubles straight off of the MPlug, in
+        Maya's internal units, i.e. centimeters and radians. Same
+        as read() when no unit is given, including the cached value
+        it stores, without its dispatch on type of attribute.
+
+        """
+
+        mplug = self._mplug
+
+        if self._unit is not None or mplug.isArray or (
+                mplug.attribute().apiType() not in _Double3Types):
+            return self.read(time=time)
+
+        if time is not None:
+            context = DGContext(time=time)
+            value = (mplug.child(0).asDouble(context),
+                     mplug.child(1).asDouble(context),
+                     mplug.child(2).asDouble(context))
+        else:
+            value = (mplug.child(0).asDouble(),
+                     mplug.child(1).asDouble(),
+                     mplug.child(2).asDouble())
+
+        # Store cached value, like read()
+        values = self._node._values
+        if values is None:
+            values = self._node._values = dict()
+
+        values[self._key] = value
+
+        return value
+
     def asEulerRotation(self, order=kXYZ, time=None):
-        value = self.read(time=time)
+        value = self._read3(time)
         return Euler(om.MEulerRotation(value, order))
 
     asEuler = asEulerRotation
 
     def asQuaternion(self, time=None):
-        value = self.read(time=time)
+        value = self._read3(time)
         value = Euler(value).asQuaternion()
         return Quaternion(value)
 
     def asVector(self, time=None):
         assert self.isArray or self.isCompound, "'%s' not an array" % self
-        return Vector(self.read(time=time))
+        return Vector(self._read3(time))
 
     def asPoint(self, time=None):
         assert self.isArray or self.isCompound, "'%s' not an array" % self
-        return Point(self.read(time=time))
+        return Point(self._read3(time))
 
     def asTime(self, time=None):
         attr = self._mplug.attribute()
@@ -3377,7 +3811,7 @@ class Plug(object):
 
         """
 
-        return self.connection(destination=False) is not None
+        return self._mplug.isDestination
 
     def animated(self, recursive=True):
         """Return whether this attribute is connected to an animCurve
@@ -3689,8 +4123,22 @@ class Plug(object):
 
         """
 
-        self.keyable = False
-        self.channelBox = False
+        elements = (
+            self
+            if self.isArray or self.isCompound
+            else [self]
+        )
+
+        # Both in one go, rather than via self.keyable
+        # and self.channelBox, each visiting every element
+        for el in elements:
+            if el._mplug.isDynamic:
+                # Use setAttr as neither persist on
+                # scene save for dynamic attributes.
+                cmds.setAttr(el.path(), keyable=False, channelBox=False)
+            else:
+                el._mplug.isKeyable = False
+                el._mplug.isChannelBox = False
 
     def lockAndHide(self):
         self.lock()
@@ -3898,70 +4346,28 @@ class Plug(object):
 
         attr = self._mplug.attribute()
         typ = attr.apiType()
+        cls = _TypeClasses.get(typ)
 
-        if typ == om.MFn.kAttribute3Double:
-            return Double3
+        if cls is not None:
+            return cls
 
-        elif typ == om.MFn.kNumericAttribute:
+        # These need a closer look at the attribute
+        if typ == om.MFn.kNumericAttribute:
             typ = om.MFnNumericAttribute(attr).numericType()
-            if typ == om.MFnNumericData.kBoolean:
-                return Boolean
-
-            elif typ in (om.MFnNumericData.kLong,
-                         om.MFnNumericData.kInt):
-                return Long
-
-            elif typ == om.MFnNumericData.kDouble:
-                return Double
-
-            elif typ == om.MFnNumericData.kFloat:
-                return Float
-
-        elif typ in (om.MFn.kDoubleAngleAttribute,
-                     om.MFn.kFloatAngleAttribute):
-            return Angle
-
-        elif typ in (om.MFn.kDoubleLinearAttribute,
-                     om.MFn.kFloatLinearAttribute):
-            return Distance
-
-        elif typ == om.MFn.kTimeAttribute:
-            return Time
-
-        elif typ == om.MFn.kEnumAttribute:
-            return Enum
+            cls = _NumericTypeClasses.get(typ)
 
         elif typ == om.MFn.kUnitAttribute:
             typ = om.MFnUnitAttribute(attr).unitType()
-            if typ == om.MFnUnitAttribute.kAngle:
-                return Angle
-
-            elif typ == om.MFnUnitAttribute.kDistance:
-                return Distance
-
-            elif typ == om.MFnUnitAttribute.kTime:
-                return Time
+            cls = _UnitTypeClasses.get(typ)
 
         elif typ == om.MFn.kTypedAttribute:
             typ = om.MFnTypedAttribute(attr).attrType()
-            if typ == om.MFnData.kString:
-                return String
-
-            elif typ == om.MFnData.kMatrix:
-                return Matrix
-
-        elif typ == om.MFn.kCompoundAttribute:
-            return Compound
-
-        elif typ in (om.MFn.kMatrixAttribute,
-                     om.MFn.kFloatMatrixAttribute):
-            return Matrix
+            cls = _TypedTypeClasses.get(typ)
 
-        elif typ == om.MFn.kMessageAttribute:
-            return Message
+        if cls is None:
+            raise TypeError('%s is not implemented' % attr.apiTypeStr)
 
-        apitype = self._mplug.attribute().apiTypeStr
-        raise TypeError('%s is not implemented' % apitype)
+        return cls
 
     def path(self, full=False):
         """Return path to attribute, including node path
@@ -4012,7 +4418,9 @@ class Plug(object):
 
         """
 
-        return "{}".format(
+        # str() rather than a format string, which in Python 3
+        # returns the name as-is rather than a copy of it
+        return str(
             self._mplug.partialName(
                 includeNodeName=False,
                 useLongNames=long,
@@ -4041,15 +4449,35 @@ class Plug(object):
         unit = unit if unit is not None else self._unit
         context = None if time is None else DGContext(time=time)
 
+        # Single values in default units, by far the most common
+        # read, are looked up rather than dispatched on type
+        reader = None
+        mplug = self._mplug
+        if unit is None and context is None and not (
+                mplug.isArray or mplug.isCompound):
+            reader = _simple_reader(mplug.attribute())
+
         try:
-            value = _plug_to_python(
-                self._mplug,
-                unit=unit,
-                context=context
-            )
+            if reader is not None:
+                value = reader(mplug)
+            else:
+                value = _plug_to_python(
+                    mplug,
+                    unit=unit,
+                    context=context
+                )
 
             # Store cached value
-            self._node._state["values"][self._key, unit] = value
+            values = self._node._values
+            if values is None:
+                values = self._node._values = dict()
+
+            # Values in default units, by far the most common,
+            # are keyed by name alone to spare building a tuple
+            if unit is None:
+                values[self._key] = value
+            else:
+                values[self._key, unit] = value
 
             return value
 
@@ -4110,8 +4538,9 @@ class Plug(object):
     def connect(self, other, force=True):
         mod = om.MDGModifier()
 
-        if force:
-            # Disconnect any plug connected to `other`
+        # Disconnect any plug connected to `other`, which
+        # most of the time is none, so check before listing
+        if force and other._mplug.isDestination:
             for plug in other._mplug.connectedTo(True, False):
                 mod.disconnect(plug, other._mplug)
 
@@ -4430,13 +4859,12 @@ class TransformationMatrix(om.MTransformationMatrix):
     def zAxis(self):
         return self.quaternion() * Vector(0, 0, 1)
 
-    def translateBy(self, vec, space=None):
-        space = space or sTransform
+    def translateBy(self, vec, space=sTransform):
         if isinstance(vec, (tuple, list)):
             vec = Vector(vec)
         return super(TransformationMatrix, self).translateBy(vec, space)
 
-    def rotateBy(self, rot, space=None):
+    def rotateBy(self, rot, space=sTransform):
         """Handle arguments conveniently
 
         - Allow for optional `space` argument
@@ -4447,7 +4875,6 @@ class TransformationMatrix(om.MTransformationMatrix):
 
         """
 
-        space = space or sTransform
         if isinstance(rot, (tuple, list)):
             rot = Vector(rot)
 
@@ -4456,18 +4883,16 @@ class TransformationMatrix(om.MTransformationMatrix):
 
         return super(TransformationMatrix, self).rotateBy(rot, space)
 
-    def scale(self, space=None):
+    def scale(self, space=sTransform):
         """Make space into an optional argument"""
-        space = space or sTransform
         return Vector(super(TransformationMatrix, self).scale(space))
 
     def quaternion(self):
         """Return transformation matrix as a Quaternion"""
         return Quaternion(self.rotation(asQuaternion=True))
 
-    def rotatePivot(self, space=None):
+    def rotatePivot(self, space=sTransform):
         """This method does not typically support optional arguments"""
-        space = space or sTransform
         return Vector(super(TransformationMatrix, self).rotatePivot(space))
 
     def rotatePivotTranslation(self, space=sTransform):
@@ -4506,27 +4931,24 @@ class TransformationMatrix(om.MTransformationMatrix):
         return super(TransformationMatrix, self).setScalePivotTranslation(
             pivot, space)
 
-    def translation(self, space=None):  # type: (om.MSpace) -> om.MVector
+    def translation(self, space=sTransform):  # type: (int) -> om.MVector
         """This method does not typically support optional arguments"""
-        space = space or sTransform
         return Vector(super(TransformationMatrix, self).translation(space))
 
-    def setTranslation(self, trans, space=None):
+    def setTranslation(self, trans, space=sTransform):
         if isinstance(trans, Plug):
             trans = trans.as_vector()
 
         if isinstance(trans, (tuple, list)):
             trans = Vector(*trans)
 
-        space = space or sTransform
         return super(TransformationMatrix, self).setTranslation(trans, space)
 
-    def scaleBy(self, space=None):
+    def scaleBy(self, space=sTransform):
         """This method does not typically support optional arguments"""
-        space = space or sTransform
         return Vector(super(TransformationMatrix, self).scale(space))
 
-    def setScale(self, seq, space=None):
+    def setScale(self, seq, space=sTransform):
         """This method does not typically support optional arguments"""
         if isinstance(seq, Plug):
             seq = seq.as_vector()
@@ -4534,7 +4956,6 @@ class TransformationMatrix(om.MTransformationMatrix):
         if isinstance(seq, (tuple, list)):
             seq = Vector(*seq)
 
-        space = space or sTransform
         return super(TransformationMatrix, self).setScale(seq, space)
 
     def rotation(self, asQuaternion=False):
@@ -4550,7 +4971,7 @@ class TransformationMatrix(om.MTransformationMatrix):
             try:
                 rot = Vector(rot)
             except ValueError:
-                traceback.print_exc()
+                log.exception("Could not convert %s to Vector" % str(rot))
                 raise ValueError(
                     "I tried automatically converting your "
                     "tuple to a Vector, but couldn't.."
@@ -4597,22 +5018,19 @@ class MatrixType(om.MMatrix):
             "%.2f %.2f %.2f %.2f"
         )
 
-        return fmt % (
-            self(0, 0), self(0, 1), self(0, 2), self(0, 3),
-            self(1, 0), self(1, 1), self(1, 2), self(1, 3),
-            self(2, 0), self(2, 1), self(2, 2), self(2, 3),
-            self(3, 0), self(3, 1), self(3, 2), self(3, 3),
-        )
+        # Row-major, like the values themselves
+        return fmt % tuple(self)
 
     def __repr__(self):
         value = "\n".join("  " + line for line in str(self).split("\n"))
         return "%s.Matrix4(\n%s\n)" % (__name__, value)
 
     def __call__(self, *item):
-        """Native API 2.0 MMatrix does not support indexing
+        """Index the matrix by row, or by row and column
 
-        API 1.0 however *does*, except only for elements
-        and not rows. Screw both of those, indexing isn't hard.
+        Native API 2.0 MMatrix only indexes its 16 values as one flat
+        sequence, and API 1.0 only by element. This takes either a row,
+        or a row and column, on top of that flat sequence.
 
         Arguments:
             item (int, tuple): 1 integer for row, 2 for element
@@ -4638,6 +5056,15 @@ class MatrixType(om.MMatrix):
             >>>
             >>> m(0)
             (1.0, 0.0, 0.0, 0.0)
+            >>>
+            >>> m = MatrixType([1, 0, 0, 0,
+            ...                 0, 1, 0, 0,
+            ...                 0, 0, 1, 0,
+            ...                 1, 2, 3, 1])
+            >>> m(3)
+            (1.0, 2.0, 3.0, 1.0)
+            >>> m(3, 1)
+            2.0
 
         """
 
@@ -4663,17 +5090,18 @@ class MatrixType(om.MMatrix):
         return type(self)(super(MatrixType, self).inverse())
 
     def row(self, index):
-        values = tuple(self)
+        # MMatrix indexes its 16 values as a flat sequence,
+        # spare copying all of them to get at four
+        index *= 4
         return (
-            values[index * 4 + 0],
-            values[index * 4 + 1],
-            values[index * 4 + 2],
-            values[index * 4 + 3]
+            self[index + 0],
+            self[index + 1],
+            self[index + 2],
+            self[index + 3]
         )
 
     def element(self, row, col):
-        values = tuple(self)
-        return values[row * 4 + col % 4]
+        return self[row * 4 + col % 4]
 
     def isEquivalent(self, other, tolerance=1e-10):
         return super(MatrixType, self).isEquivalent(other, tolerance)
@@ -4723,14 +5151,29 @@ class Vector(om.MVector):
         return Vector(super(Vector, self).__add__(value))
 
     def __iadd__(self, value):
+        """Add to this vector in place
+
+        Example:
+            >>> vec = Vector(1, 2, 3)
+            >>> same = vec
+            >>> vec += 1
+            >>> vec += Vector(1, 0, 0)
+            >>> vec is same
+            True
+            >>> vec
+            maya.api.OpenMaya.MVector(3, 3, 4)
+
+        """
+
         if isinstance(value, (int, float)):
-            return type(self)(
-                self.x + value,
-                self.y + value,
-                self.z + value,
-            )
+            self.x += value
+            self.y += value
+            self.z += value
+
+        else:
+            super(Vector, self).__iadd__(value)
 
-        return Vector(super(Vector, self).__iadd__(value))
+        return self
 
     def dot(self, value):
         return Vector(super(Vector, self).__mul__(value))
@@ -4880,6 +5323,14 @@ def twistSwingToQuaternion(ts):
     Arguments:
         ts (Vector): Twist, swing1 and swing2
 
+    Example:
+        >>> q = twistSwingToQuaternion(Vector(0, 0, 0))
+        >>> q == Quaternion()
+        True
+        >>> q = twistSwingToQuaternion(Vector(radians(90), 0, 0))
+        >>> q.isEquivalent(Quaternion(radians(-90), Vector(1, 0, 0)))
+        True
+
     """
 
     t = tan(ts.x * 0.25)
@@ -4888,14 +5339,21 @@ def twistSwingToQuaternion(ts):
 
     b = 2.0 / (1.0 + s1 * s1 + s2 * s2)
     c = 2.0 / (1.0 + t * t)
+    b1 = b - 1.0
+    c1 = c - 1.0
+    ct = c * t
+
+    # x, y, z, w
+    quat = Quaternion(
+        -t * b1 * c,
+        -b * (ct * s1 + c1 * s2),
+        -b * (ct * s2 - c1 * s1),
+        b1 * c1,
+    )
 
-    quat = Quaternion()
-    quat.w = (b - 1.0) * (c - 1.0)
-    quat.x = -t * (b - 1.0) * c
-    quat.y = -b * (c * t * s1 + (c - 1.0) * s2)
-    quat.z = -b * (c * t * s2 - (c - 1.0) * s1)
+    if SAFE_MODE:
+        assert quat.isNormalised()
 
-    assert quat.isNormalised()
     return quat
 
 
@@ -4975,14 +5433,12 @@ def NurbsCurveData(points, degree=1, form=om.MFnNurbsCurve.kOpen):
 
     degree = min(3, max(1, degree))
 
-    cvs = om.MPointArray()
+    # Sized once, rather than grown one point at a time
+    cvs = om.MPointArray([om.MPoint(*point) for point in points])
     curveFn = om.MFnNurbsCurve()
     data = om.MFnNurbsCurveData()
     mobj = data.create()
 
-    for point in points:
-        cvs.append(om.MPoint(*point))
-
     curveFn.createWithEditPoints(cvs,
                                  degree,
                                  form,
@@ -4997,6 +5453,8 @@ def NurbsCurveData(points, degree=1, form=om.MFnNurbsCurve.kOpen):
 class CachedPlug(Plug):
     """Returned in place of an actual plug"""
 
+    __slots__ = ("_value",)
+
     def __init__(self, value):
         self._value = value
 
@@ -5035,6 +5493,110 @@ def _plug_to_default(mplug):
         raise TypeError("Attribute type '%s' unsupported" % type)
 
 
+# Readers of single-valued plugs, by attribute type. Each
+# returns the same value as _plug_to_python, in default units
+_NumericReaders = {
+    om.MFnNumericData.kBoolean: om.MPlug.asBool,
+    om.MFnNumericData.kShort: om.MPlug.asInt,
+    om.MFnNumericData.kInt: om.MPlug.asInt,
+    om.MFnNumericData.kLong: om.MPlug.asInt,
+    om.MFnNumericData.kByte: om.MPlug.asInt,
+    om.MFnNumericData.kFloat: om.MPlug.asDouble,
+    om.MFnNumericData.kDouble: om.MPlug.asDouble,
+    om.MFnNumericData.kAddr: om.MPlug.asDouble,
+}
+
+_SimpleReaders = {
+    om.MFn.kDoubleLinearAttribute:
+        lambda plug: plug.asMDistance().asUnits(Centimeters),
+    om.MFn.kFloatLinearAttribute:
+        lambda plug: plug.asMDistance().asUnits(Centimeters),
+    om.MFn.kDoubleAngleAttribute:
+        lambda plug: plug.asMAngle().asUnits(Radians),
+    om.MFn.kFloatAngleAttribute:
+        lambda plug: plug.asMAngle().asUnits(Radians),
+    om.MFn.kTimeAttribute:
+        lambda plug: plug.asMTime().asUnits(Seconds),
+    om.MFn.kEnumAttribute: om.MPlug.asShort,
+    om.MFn.kMessageAttribute: lambda plug: True,
+}
+
+
+def _simple_reader(attr):
+    """Return function reading a plug of `attr`, or None if unsupported
+
+    Arguments:
+        attr (om.MObject): Attribute of a non-array, non-compound plug
+
+    """
+
+    type = attr.apiType()
+
+    if type == om.MFn.kNumericAttribute:
+        innerType = om.MFnNumericAttribute(attr).numericType()
+        return _NumericReaders.get(innerType)
+
+    return _SimpleReaders.get(type)
+
+
+# Static attributes are the same for every node of a type,
+# so their names and readers are only looked up once per type
+_DumpLayouts = dict()
+
+
+def _dump_entry(attr, plug):
+    """Return name and reader of `plug`, reader being None if unsupported"""
+    reader = None
+    if not (plug.isArray or plug.isCompound):
+        reader = _simple_reader(attr)
+
+    return plug.name().split(".", 1)[-1], reader
+
+
+def _dump_layout(fn):
+    """Return (name, reader) of each static attribute of `fn`, by index"""
+    key = (fn.typeId.id(), fn.typeName)
+
+    try:
+        return _DumpLayouts[key]
+    except KeyError:
+        pass
+
+    layout = list()
+    for index in range(fn.attributeCount()):
+        attr = fn.attribute(index)
+
+        # Dynamic attributes follow static ones
+        if om.MFnAttribute(attr).dynamic:
+            break
+
+        plug = fn.findPlug(attr, False)
+        layout.append(_dump_entry(attr, plug))
+
+    _DumpLayouts[key] = layout
+    return layout
+
+
+# Conversions of distances and angles, by unit
+_DistanceConverters = {
+    Millimeters: om.MDistance.asMillimeters,
+    Centimeters: om.MDistance.asCentimeters,
+    Meters: om.MDistance.asMeters,
+    Kilometers: om.MDistance.asKilometers,
+    Inches: om.MDistance.asInches,
+    Feet: om.MDistance.asFeet,
+    Miles: om.MDistance.asMiles,
+    Yards: om.MDistance.asYards,
+}
+
+_AngleConverters = {
+    Degrees: om.MAngle.asDegrees,
+    Radians: om.MAngle.asRadians,
+    AngularSeconds: om.MAngle.asAngSeconds,
+    AngularMinutes: om.MAngle.asAngMinutes,
+}
+
+
 def _plug_to_python(plug, unit=None, context=None):
     """Convert native `plug` to Python type
 
@@ -5083,13 +5645,23 @@ def _plug_to_python(plug, unit=None, context=None):
     elif plug.isArray:
         # E.g. transform["worldMatrix"][0]
         # E.g. locator["worldPosition"][0]
+        count = plug.evaluateNumElements()
+        element = plug.elementByLogicalIndex
+
+        # Elements share one attribute, so single values
+        # are read without dispatching on type per element
+        if unit is None and context is None:
+            reader = _simple_reader(plug.attribute())
+
+            if reader is not None:
+                return tuple(
+                    reader(element(index))
+                    for index in range(count)
+                )
+
         return tuple(
-            _plug_to_python(
-                plug.elementByLogicalIndex(index),
-                unit,
-                context
-            )
-            for index in range(plug.evaluateNumElements())
+            _plug_to_python(element(index), unit, context)
+            for index in range(count)
         )
 
     elif plug.isCompound:
@@ -5106,6 +5678,13 @@ def _plug_to_python(plug, unit=None, context=None):
     #  |_____|
     #
     attr = plug.attribute()
+
+    if unit is None and context is None:
+        reader = _simple_reader(attr)
+
+        if reader is not None:
+            return reader(plug)
+
     type = attr.apiType()
     if type == om.MFn.kTypedAttribute:
         innerType = om.MFnTypedAttribute(attr).attrType()
@@ -5152,40 +5731,26 @@ def _plug_to_python(plug, unit=None, context=None):
 
         if unit is None:
             return plug.asMDistance(**kwargs).asUnits(Centimeters)
-        elif unit == Millimeters:
-            return plug.asMDistance(**kwargs).asMillimeters()
-        elif unit == Centimeters:
-            return plug.asMDistance(**kwargs).asCentimeters()
-        elif unit == Meters:
-            return plug.asMDistance(**kwargs).asMeters()
-        elif unit == Kilometers:
-            return plug.asMDistance(**kwargs).asKilometers()
-        elif unit == Inches:
-            return plug.asMDistance(**kwargs).asInches()
-        elif unit == Feet:
-            return plug.asMDistance(**kwargs).asFeet()
-        elif unit == Miles:
-            return plug.asMDistance(**kwargs).asMiles()
-        elif unit == Yards:
-            return plug.asMDistance(**kwargs).asYards()
-        else:
+
+        try:
+            convert = _DistanceConverters[unit]
+        except KeyError:
             raise TypeError("Unsupported unit '%d'" % unit)
 
+        return convert(plug.asMDistance(**kwargs))
+
     elif type in (om.MFn.kDoubleAngleAttribute,
                   om.MFn.kFloatAngleAttribute):
         if unit is None:
             return plug.asMAngle(**kwargs).asUnits(Radians)
-        elif unit == Degrees:
-            return plug.asMAngle(**kwargs).asDegrees()
-        elif unit == Radians:
-            return plug.asMAngle(**kwargs).asRadians()
-        elif unit == AngularSeconds:
-            return plug.asMAngle(**kwargs).asAngSeconds()
-        elif unit == AngularMinutes:
-            return plug.asMAngle(**kwargs).asAngMinutes()
-        else:
+
+        try:
+            convert = _AngleConverters[unit]
+        except KeyError:
             raise TypeError("Unsupported unit '%d'" % unit)
 
+        return convert(plug.asMAngle(**kwargs))
+
     # Number
     elif type == om.MFn.kNumericAttribute:
         innerType = om.MFnNumericAttribute(attr).numericType()
@@ -5229,6 +5794,18 @@ def _plug_to_python(plug, unit=None, context=None):
         raise TypeError("Unsupported type '%s'" % type)
 
 
+# Writers of plain Python values to single-value plugs, by exact type.
+# Anything else, including subclasses, goes through _python_to_plug
+_PythonWriters = {
+    float: om.MPlug.setDouble,
+    int: om.MPlug.setInt,
+}
+
+_PythonWriters.update(
+    (string_type, om.MPlug.setString) for string_type in string_types
+)
+
+
 def _python_to_plug(value, plug):
     """Pass value of `value` to `plug`
 
@@ -5238,6 +5815,11 @@ def _python_to_plug(value, plug):
 
     """
 
+    # Plain values, by far the most common
+    writer = _PythonWriters.get(type(value))
+    if writer is not None and not plug._mplug.isCompound:
+        return writer(plug._mplug, value)
+
     # Compound values
 
     if isinstance(value, (tuple, list)):
@@ -5584,14 +6166,19 @@ def find(path, default=None):
 def fromHash(code, default=None):
     """Get existing node from MObjectHandle.hashCode()"""
     try:
-        return Singleton._instances["%x" % code]
+        return Singleton._instances[code]
     except KeyError:
         return default
 
 
 def fromHex(hex, default=None, safe=True):
     """Get existing node from Node.hex"""
-    node = Singleton._instances.get(hex, default)
+    try:
+        key = int(hex, 16)
+    except (TypeError, ValueError):
+        return default
+
+    node = Singleton._instances.get(key, default)
     if safe and node and node.exists:
         return node
     else:
@@ -5692,6 +6279,10 @@ def clear():
 
     Singleton._instances.clear()
 
+    # E.g. a reloaded plug-in may have new attributes
+    _DumpLayouts.clear()
+    _AttributeCache.clear()
+
     if ENABLE_UNDO:
 
         # Traces left in here can trick Maya into thinking
@@ -6116,7 +6707,7 @@ class _BaseModifier(object):
             if self._opts["atomic"]:
                 self._modifier.undoIt()
 
-            traceback.print_exc()
+            log.exception("Modifier failed")
             raise ModifierError(self._history)
 
         else:
@@ -7572,11 +8163,14 @@ def editCurve(parent, points, degree=1, form=kOpen):
 
     degree = min(3, max(1, degree))
 
+    points = list(points)
     cvs = om1.MPointArray()
     curveFn = om1.MFnNurbsCurve()
 
-    for point in points:
-        cvs.append(om1.MPoint(*point))
+    # Sized once and filled in place, sparing an MPoint per point
+    cvs.setLength(len(points))
+    for index, point in enumerate(points):
+        cvs.set(index, *point)
 
     mobj = curveFn.createWithEditPoints(cvs,
                                         degree,
@@ -8354,6 +8948,40 @@ Distance2Attribute = Distance2
 Distance3Attribute = Distance3
 Distance4Attribute = Distance4
 
+# Attribute classes by type of attribute, see Plug.typeClass
+_TypeClasses = {
+    om.MFn.kAttribute3Double: Double3,
+    om.MFn.kDoubleAngleAttribute: Angle,
+    om.MFn.kFloatAngleAttribute: Angle,
+    om.MFn.kDoubleLinearAttribute: Distance,
+    om.MFn.kFloatLinearAttribute: Distance,
+    om.MFn.kTimeAttribute: Time,
+    om.MFn.kEnumAttribute: Enum,
+    om.MFn.kCompoundAttribute: Compound,
+    om.MFn.kMatrixAttribute: Matrix,
+    om.MFn.kFloatMatrixAttribute: Matrix,
+    om.MFn.kMessageAttribute: Message,
+}
+
+_NumericTypeClasses = {
+    om.MFnNumericData.kBoolean: Boolean,
+    om.MFnNumericData.kLong: Long,
+    om.MFnNumericData.kInt: Long,
+    om.MFnNumericData.kDouble: Double,
+    om.MFnNumericData.kFloat: Float,
+}
+
+_UnitTypeClasses = {
+    om.MFnUnitAttribute.kAngle: Angle,
+    om.MFnUnitAttribute.kDistance: Distance,
+    om.MFnUnitAttribute.kTime: Time,
+}
+
+_TypedTypeClasses = {
+    om.MFnData.kString: String,
+    om.MFnData.kMatrix: Matrix,
+}
+
 
 # --------------------------------------------------------
 #
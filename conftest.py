@@ -0,0 +1,42 @@
+"""Initialise Maya once per test process
+
+Runs prior to collection, since tests.py and cmdx.py query Maya on
+import. With pytest-xdist, only the workers collect and run tests, so
+the controlling process leaves Maya alone.
+
+"""
+
+import os
+import sys
+
+
+def pytest_configure(config):
+    # For nose.tools, imported by tests
+    if sys.version_info[0] == 3:
+        import collections
+        collections.Callable = collections.abc.Callable
+
+    if os.getenv("CMDX_TESTSERVER"):
+        # Already initialised, see testserver.py
+        return
+
+    distributed = getattr(config.option, "numprocesses", None)
+    if distributed and not hasattr(config, "workerinput"):
+        # The xdist controller, tests run in workers
+        return
+
+    print("Initialising Maya..")
+    from maya import standalone, cmds
+    standalone.initialize()
+    cmds.loadPlugin("matrixNodes", quiet=True)
+
+
+def pytest_unconfigure(config):
+    distributed = getattr(config.option, "numprocesses", None)
+    if distributed and not hasattr(config, "workerinput"):
+        return
+
+    if os.name == "nt" and not os.getenv("CMDX_TESTSERVER"):
+        # Graceful exit, only Windows seems to like this consistently
+        from maya import standalone
+        standalone.uninitialize()
@@ -1,79 +1,232 @@
 """Generate cmdt.py, with all available Type IDs"""
 import os
 import sys
+import hashlib
+import py_compile
+import multiprocessing
 
 from maya.api import OpenMaya as om
 from maya import standalone, cmds
 
+# Number of node types handed to a worker at a time
+ChunkSize = 64
 
-def main(fname=None):
-    standalone.initialize()
+Blacklist = frozenset((
+    # Causes crash (Maya 2018)
+    "caddyManipBase",
+
+    # Causes TypeError
+    "applyAbsOverride",
+    "applyOverride",
+    "applyRelOverride",
+    "childNode",
+    "lightItemBase",
+    "listItem",
+    "override",
+    "selector",
+    "valueOverride",
+))
+
+# Type IDs are stored as integers and only made into
+# an MTypeId once accessed, which for most is never.
+Header = '''\
+import sys
+
+from maya.api import OpenMaya as om
+
+_IDS = {'''
+
+Footer = '''\
+}
 
-    blacklist = (
-        # Causes crash (Maya 2018)
-        "caddyManipBase",
-
-        # Causes TypeError
-        "applyAbsOverride",
-        "applyOverride",
-        "applyRelOverride",
-        "childNode",
-        "lightItemBase",
-        "listItem",
-        "override",
-        "selector",
-        "valueOverride",
+
+def __getattr__(name):
+    value = _IDS.get(name)
+
+    if value is None:
+        raise AttributeError(name)
+
+    typeid = om.MTypeId(value)
+    globals()[name] = typeid
+    return typeid
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_IDS))
+
+
+# Module-level __getattr__ requires Python 3.7
+if sys.version_info < (3, 7):
+    globals().update(
+        (name, om.MTypeId(value)) for name, value in _IDS.items()
     )
+'''
 
-    cmdt = [
-        "from maya.api import OpenMaya as om",
-        ""
+
+def _initialize():
+    """Give each worker process a Maya of its own"""
+    standalone.initialize()
+
+
+def _all_node_types():
+    return cmds.allNodeTypes()
+
+
+def _fingerprint():
+    """Identify the Maya version and plug-ins that node types come from"""
+    plugins = sorted(cmds.pluginInfo(query=True, listPlugins=True) or [])
+    fingerprint = [cmds.about(version=True)]
+    fingerprint += [
+        "%s=%s" % (plugin, cmds.pluginInfo(plugin, query=True, version=True))
+        for plugin in plugins
     ]
 
-    dg = om.MFnDependencyNode()
-    for name in cmds.allNodeTypes():
-        if name in blacklist:
-            continue
+    return hashlib.sha1(
+        "\n".join(fingerprint).encode("utf-8")
+    ).hexdigest()
+
+
+def _read_fingerprint(fname):
+    """Return fingerprint from the header of an existing `fname`, if any"""
+    try:
+        with open(fname) as f:
+            header = f.readline()
+    except IOError:
+        return None
+
+    prefix = "# fingerprint: "
+    if header.startswith(prefix):
+        return header[len(prefix):].strip()
+
+    return None
+
+
+def collect_typeids(names):
+    """Create one of each node in `names` and return their Type IDs
+
+    Arguments:
+        names (list): Names of node types, e.g. ["transform", "mesh"]
+
+    Returns:
+        dict: {name: typeId} for each node type successfully created
+
+    """
 
-        try:
-            mobj = dg.create(name)
-            print(mobj.apiType())
-            fn = om.MFnDependencyNode
+    typeids = {}
+
+    # Nodes are thrown away, there is nothing to undo
+    undo = cmds.undoInfo(query=True, state=True)
+    cmds.undoInfo(stateWithoutFlush=False)
+
+    try:
+        dg = om.MFnDependencyNode()
+        fn = om.MFnDependencyNode
+        for name in names:
             try:
+                mobj = dg.create(name)
+
                 # If `name` is a shape, then the transform
                 # is returned. We need the shape.
-                mobj = om.MFnDagNode(mobj).child(0)
-            except RuntimeError:
-                pass
-
-        except TypeError:
-            # This shouldn't happen, but might depending
-            # on the Maya version, and if there are any
-            # custom plug-ins registereing new (bad) nodes.
-            #
-            # If so:
-            #   Add to `blacklist`
-            #
-            sys.stderr.write("%s threw a TypeError\n" % name)
-            continue
-
-        typeId = fn(mobj).typeId
-        cmdt += ["{type} = om.MTypeId({id})".format(
-            type=name[0].upper() + name[1:],
-            id=str(typeId))
-        ]
+                if mobj.hasFn(om.MFn.kDagNode):
+                    dag = om.MFnDagNode(mobj)
+
+                    if dag.childCount():
+                        mobj = dag.child(0)
+
+            except TypeError:
+                # This shouldn't happen, but might depending
+                # on the Maya version, and if there are any
+                # custom plug-ins registereing new (bad) nodes.
+                #
+                # If so:
+                #   Add to `Blacklist`
+                #
+                sys.stderr.write("%s threw a TypeError\n" % name)
+                continue
+
+            typeids[name] = str(fn(mobj).typeId)
+
+    finally:
+        cmds.undoInfo(stateWithoutFlush=undo)
 
-    text = os.linesep.join(cmdt)
+        # Keep memory in check, by not accumulating
+        # the nodes of every chunk in the same scene
+        cmds.file(new=True, force=True)
 
+    return typeids
+
+
+def main(fname=None, processes=None, force=False):
     dirname = os.path.dirname(__file__)
     fname = fname or os.path.join(dirname, "cmdt.py")
-    with open(fname, "w") as f:
-        f.write(text)
+
+    # Maya is only ever initialised in worker processes. A single one
+    # tells whether anything has changed, before paying for the rest.
+    pool = multiprocessing.Pool(1, initializer=_initialize)
+
+    try:
+        fingerprint = pool.apply(_fingerprint)
+
+        # Type IDs only change alongside Maya and its plug-ins
+        if not force and fingerprint == _read_fingerprint(fname):
+            print("%s is up to date" % fname)
+            return
+
+        names = [
+            name for name in pool.apply(_all_node_types)
+            if name not in Blacklist
+        ]
+
+    finally:
+        # Maya is prone to crashing on a graceful exit
+        pool.terminate()
+
+    chunks = [
+        names[index:index + ChunkSize]
+        for index in range(0, len(names), ChunkSize)
+    ]
+
+    # Each worker creates their share of nodes in parallel with the others
+    pool = multiprocessing.Pool(
+        processes or multiprocessing.cpu_count(),
+        initializer=_initialize
+    )
+
+    try:
+        typeids = {}
+        for result in pool.imap_unordered(collect_typeids, chunks):
+            typeids.update(result)
+
+    finally:
+        pool.terminate()
+
+    cmdt = [
+        "# fingerprint: %s" % fingerprint,
+    ]
+
+    cmdt.extend(Header.splitlines())
+
+    for name in sorted(typeids, key=lambda name: name[0].upper() + name[1:]):
+        cmdt.append("    \"%s\": %s," % (
+            name[0].upper() + name[1:], typeids[name]
+        ))
+
+    cmdt.extend(Footer.splitlines())
+
+    with open(fname, "wb") as f:
+        f.writelines((line + "\n").encode("utf-8") for line in cmdt)
+
+    # Spare the first import from parsing thousands of lines
+    py_compile.compile(fname, doraise=True)
 
 
 if __name__ == '__main__':
     import argparse
     parser = argparse.ArgumentParser()
     parser.add_argument("--fname", default="")
+    parser.add_argument("--processes", type=int, default=0,
+                        help="Number of Maya processes, defaults to CPU count")
+    parser.add_argument("--force", action="store_true",
+                        help="Regenerate even if Maya and plug-ins are the same")
     opt = parser.parse_args()
-    main(opt.fname)
+    main(opt.fname, opt.processes, opt.force)
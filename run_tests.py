@@ -2,57 +2,80 @@
 
 import os
 import sys
-import nose
-import flaky.flaky_nose_plugin as flaky
+import multiprocessing
 
-# For nose
-if sys.version_info[0] == 3:
-    import collections
-    collections.Callable = collections.abc.Callable
+import pytest
 
 
 if __name__ == "__main__":
-    print("Initialising Maya..")
-    from maya import standalone, cmds
-    standalone.initialize()
-    cmds.loadPlugin("matrixNodes", quiet=True)
+    import argparse
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--safe", action="store_true",
+                        help="Run with CMDX_SAFE_MODE, with extra "
+                             "checks and without the attribute cache")
+    parser.add_argument("--perf", action="store_true",
+                        help="Include test_performance.py")
+
+    # Anything else is passed on to pytest
+    opt, argv = parser.parse_known_args()
+
+    environ = {}
+
+    if opt.safe:
+        environ["CMDX_SAFE_MODE"] = "1"
+
+    # Inherited by workers
+    os.environ.update(environ)
 
-    argv = sys.argv[:]
     argv.extend([
         "--verbose",
-        "--with-doctest",
-
-        "--with-flaky",
-        "--with-coverage",
-        "--cover-html",
-        "--cover-package", "cmdx",
-        "--cover-erase",
-        "--cover-tests",
+        "--doctest-modules",
 
         "tests.py",
-        "test_performance.py",
         "cmdx.py",
     ])
 
-    result = nose.main(
-        argv=argv,
-        addplugins=[flaky.FlakyPlugin()],
+    # Tracing slows tests down by a factor 2-3, only pay when used
+    coverage = bool(os.getenv("COVERAGE") == "1" or
+                    os.getenv("TRAVIS_JOB_ID"))
 
-        # We'll exit in our own way,
-        # since Maya typically enjoys throwing
-        # segfaults during cleanup of normal exits
-        exit=False
-    )
+    if coverage:
+        argv.extend([
+            "--cov", "cmdx",
+            "--cov-report", "html",
+        ])
 
-    if os.getenv("TRAVIS_JOB_ID"):
+    if opt.perf:
+        argv.append("test_performance.py")
+
+    # Each worker initialises its own Maya, see conftest.py, and is
+    # handed one whole module. Leave a core or two for the parent and OS.
+    modules = sum(1 for arg in argv if arg.endswith(".py"))
+    workers = max(1, min(multiprocessing.cpu_count() - 2, modules))
+
+    result = None
+
+    # Prefer an already running Maya, see testserver.py
+    if os.getenv("CMDX_NO_DAEMON") != "1":
+        import testserver
+        result = testserver.request(argv, environ)
+
+    if result is None:
+        # Doctests create named nodes and build on one another,
+        # keep each module on one worker and in order
+        result = pytest.main(argv + [
+            "-n", str(workers),
+            "--dist", "loadfile",
+        ])
+
+    if coverage and os.getenv("TRAVIS_JOB_ID"):
         import coveralls
         coveralls.wear()
     else:
         sys.stdout.write("Skipping coveralls\n")
 
-    if os.name == "nt":
-        # Graceful exit, only Windows seems to like this consistently
-        standalone.uninitialize()
-
-    # Trust but verify
-    os._exit(0 if result.success else 1)
+    # We'll exit in our own way,
+    # since Maya typically enjoys throwing
+    # segfaults during cleanup of normal exits
+    os._exit(int(result))
@@ -375,6 +375,8 @@ def test_timings():
     with environment("CMDX_TIMINGS") as cmdx:
         cmdx.encode("myNode")
         assert cmdx.LastTiming is not None, cmdx.LastTiming
+        assert cmdx.flushTimings() > 0
+        assert_equals(cmdx.flushTimings(), 0)
 
 
 @with_setup(new_scene)
@@ -664,3 +666,184 @@ def test_listrelatives_shapes():
     result_cmds = cmds.listRelatives('worldCube', shapes=True)
 
     assert_equals(result_cmdx, result_cmds)
+
+
+@with_setup(new_scene)
+def test_fromhash():
+    """Nodes are found by hashCode and hex alike"""
+    node = cmdx.createNode("transform")
+    assert_is(cmdx.fromHash(node.hashCode), node)
+    assert_is(cmdx.fromHex(node.hex), node)
+    assert_equals(node.hex, "%x" % node.hashCode)
+    assert_is(cmdx.fromHash(-1), None)
+
+
+@with_setup(new_scene)
+def test_setattr_double3():
+    """Writing 3 numbers to a double3 attribute"""
+    node = cmdx.createNode("transform")
+    node["translate"] = (1, 2.5, 3)
+    node["rotate"] = [0.5, 0.0, 0.0]
+    assert_equals(node["translate"].read(), (1.0, 2.5, 3.0))
+    assert_almost_equals(node["rx"].read(), 0.5, places=5)
+
+    # Not plain numbers, handled as before
+    node["translate"] = (cmdx.Meters(1), 1.0, 1.0)
+    assert_almost_equals(node["tx"].read(), 100.0, places=5)
+
+
+@with_setup(new_scene)
+def test_data():
+    """User data lives with the node"""
+    node = cmdx.createNode("transform")
+    node.data["key"] = "value"
+    assert_equals(cmdx.Node(node.object()).data, {"key": "value"})
+    assert_equals(cmdx.Node(node.object(), exists=False).data,
+                  {"key": "value"})
+    assert_equals(cmdx.createNode("transform").data, {})
+
+
+@with_setup(new_scene)
+def test_missing_attribute():
+    """A missing attribute is reported with its node"""
+    node = cmdx.createNode("transform", name="myNode")
+
+    try:
+        node["mysteryAttribute"]
+    except cmdx.ExistError as e:
+        assert_equals(str(e), "myNode.mysteryAttribute")
+    else:
+        assert False, "ExistError was not raised"
+
+
+@with_setup(new_scene)
+def test_objectset_update():
+    """Adding members to an object set"""
+    a = cmdx.createNode("transform", name="a")
+    b = cmdx.createNode("transform", name="b")
+    decompose = cmdx.createNode("decomposeMatrix")
+
+    objset = cmdx.encode(cmds.sets(empty=True, name="mySet"))
+    objset.update([a, decompose])
+    objset.add(b)
+
+    assert_equals(
+        sorted(member.name() for member in objset),
+        sorted(["a", "b", decompose.name()])
+    )
+
+
+@with_setup(new_scene)
+def test_objectset_update_undo():
+    """Adding members to an object set is undoable, by node or name"""
+    a = cmdx.createNode("transform", name="a")
+    cmdx.createNode("transform", name="b")
+
+    objset = cmdx.encode(cmds.sets(empty=True, name="mySet"))
+    objset.update([a, "b"])
+
+    assert_equals(sorted(member.name() for member in objset), ["a", "b"])
+    cmds.undo()
+    assert_equals(list(objset), [])
+
+
+@with_setup(new_scene)
+def test_hide():
+    """Hiding attributes makes them non-keyable too"""
+    node = cmdx.createNode("transform")
+    node["dynamic"] = cmdx.Double(keyable=True)
+
+    for plug in (node["translate"], node["dynamic"]):
+        plug.hide()
+        assert_equals(plug.keyable, False)
+        assert_equals(plug.channelBox, False)
+
+
+@with_setup(new_scene)
+def test_read3():
+    """Vectors and rotations are read in internal units"""
+    node = cmdx.createNode("transform")
+    node["translate"] = (1, 2, 3)
+    node["rotate"] = (0.5, 0, 0)
+
+    assert_equals(tuple(node["translate"].asVector()), (1.0, 2.0, 3.0))
+    meters = node["translate", cmdx.Meters].asVector()
+    assert_equals(tuple(round(v, 5) for v in meters), (0.01, 0.02, 0.03))
+    assert_almost_equals(node["rotate"].asEulerRotation().x, 0.5, places=5)
+
+    # Values read are cached, like with read()
+    cached = node["translate", cmdx.Cached]
+    assert isinstance(cached, cmdx.CachedPlug)
+    assert_equals(cached.read(), (1.0, 2.0, 3.0))
+
+
+@with_setup(new_scene)
+def test_compound_child_by_name():
+    """Only children of the compound itself are found by name"""
+    node = cmdx.createNode("transform")
+
+    node["translate"] = (1, 2, 3)
+
+    # Compare paths, as all three children would compare equal by value
+    assert_equals(node["translate"]["translateY"].path(),
+                  node["translateY"].path())
+    assert_equals(node["translate"]["ty"].path(),
+                  node["translateY"].path())
+    assert_equals(node["translate"]["ty"].read(), 2.0)
+    assert_raises(cmdx.ExistError, node["translate"].__getitem__, "rotateX")
+    assert_raises(cmdx.ExistError, node["translate"].__getitem__, "noExist")
+
+
+@with_setup(new_scene)
+def test_read_array():
+    """Arrays of single values read like each of their elements"""
+    node = cmdx.createNode("transform")
+    node["myArray"] = cmdx.Double(array=True)
+    node["myArray"].extend([1.0, 2.0, 3.0])
+
+    assert_equals(node["myArray"].read(), (1.0, 2.0, 3.0))
+    assert_equals(
+        node["myArray"].read(),
+        tuple(plug.read() for plug in node["myArray"])
+    )
+
+
+@with_setup(new_scene)
+def test_plug_equality():
+    """Plugs compare by value, including cached plugs and units"""
+    node = cmdx.createNode("transform")
+    node["tx"] = 100.0
+    node["tx"].read()
+
+    cached = node["tx", cmdx.Cached]
+    assert isinstance(cached, cmdx.CachedPlug)
+    assert cached == node["tx"]
+    assert node["tx"] == cached
+    assert not cached != node["tx"]
+
+    # Same plug, different unit
+    assert not node["tx", cmdx.Meters] == node["tx"]
+    assert node["tx", cmdx.Meters] != node["tx"]
+    assert node["tx"] == node["tx"]
+
+
+@with_setup(new_scene)
+def test_find_plug_alias():
+    """Aliases are found per node, and may point to an element"""
+    a = cmdx.createNode("transform", name="a")
+    b = cmdx.createNode("transform", name="b")
+    cmds.aliasAttr("height", "a.translateY")
+
+    bs1 = cmdx.createNode("blendShape", name="bs1")
+    bs2 = cmdx.createNode("blendShape", name="bs2")
+    cmds.aliasAttr("target1", "bs1.weight[0]")
+
+    # Twice, with the second lookup following the first
+    for _ in range(2):
+        assert_equals(a["height"].plug(), a["translateY"].plug())
+        assert_raises(cmdx.ExistError, b.__getitem__, "height")
+
+        plug = bs1["target1"].plug()
+        assert plug.isElement
+        assert_equals(plug.logicalIndex(), 0)
+        assert_raises(cmdx.ExistError, bs2.__getitem__, "target1")
@@ -0,0 +1,192 @@
+"""Keep Maya warm between test runs
+
+Initialising Maya takes a good 10-20 seconds, which is paid on every
+call to run_tests.py. Start this server once, and subsequent calls to
+run_tests.py are passed along to it instead.
+
+Usage:
+    $ mayapy testserver.py
+    $ mayapy run_tests.py  # From another terminal
+
+Set CMDX_NO_DAEMON=1 to have run_tests.py run locally regardless.
+
+The server runs whatever tests it is sent inside of Maya, so clients
+must know its key. Either set CMDX_TESTSERVER_AUTHKEY for both, or
+leave it unset for the server to generate one per session, stored in
+a file only readable by the current user.
+
+"""
+
+import os
+import sys
+import socket
+import binascii
+
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Listener, Client
+
+Address = ("localhost", int(os.getenv("CMDX_TESTSERVER_PORT", "6000")))
+KeyFile = os.path.join(
+    os.path.expanduser("~"), ".cmdx_testserver_%d.key" % Address[1]
+)
+
+# Modules re-imported on each run, to pick up changes
+Reload = ("cmdx", "tests", "test_performance", "conftest")
+
+
+class _Stream(object):
+    """Forward anything written to a client"""
+
+    def __init__(self, conn):
+        self._conn = conn
+
+    def write(self, text):
+        self._conn.send(("stdout", text))
+
+    def flush(self):
+        pass
+
+    def isatty(self):
+        return False
+
+
+def _read_authkey():
+    """Return key of a running server, or None if there is none"""
+    key = os.getenv("CMDX_TESTSERVER_AUTHKEY")
+
+    if key:
+        return key.encode("utf-8")
+
+    try:
+        with open(KeyFile, "rb") as f:
+            return f.read().strip() or None
+    except IOError:
+        return None
+
+
+def _write_authkey():
+    """Return a new key, readable by the current user only"""
+    key = binascii.hexlify(os.urandom(32))
+
+    if os.path.exists(KeyFile):
+        os.remove(KeyFile)
+
+    fd = os.open(KeyFile, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    with os.fdopen(fd, "wb") as f:
+        f.write(key)
+
+    return key
+
+
+def request(argv, environ=None):
+    """Run tests with `argv` on a running server
+
+    Arguments:
+        argv (list): Arguments for pytest
+        environ (dict, optional): Environment variables for this run
+
+    Returns:
+        int: Exit code of the run, or None if no server is running
+
+    """
+
+    authkey = _read_authkey()
+
+    if authkey is None:
+        return None
+
+    try:
+        conn = Client(Address, authkey=authkey)
+    except socket.error:
+        return None
+
+    try:
+        conn.send(("run", argv, environ or {}))
+
+        while True:
+            message, value = conn.recv()
+
+            if message == "stdout":
+                sys.stdout.write(value)
+
+            elif message == "exit":
+                return value
+
+    finally:
+        conn.close()
+
+
+def _run(conn, argv, environ):
+    import pytest
+    from maya import cmds
+
+    # E.g. CMDX_SAFE_MODE is read by cmdx on import
+    original = os.environ.copy()
+    os.environ.update(environ)
+
+    for name in Reload:
+        sys.modules.pop(name, None)
+
+    cmds.file(new=True, force=True)
+
+    stdout, stderr = sys.stdout, sys.stderr
+    sys.stdout = sys.stderr = _Stream(conn)
+
+    try:
+        return int(pytest.main(argv + ["--capture", "sys"]))
+
+    except Exception as e:
+        sys.stdout.write("%s\n" % e)
+        return 1
+
+    finally:
+        sys.stdout, sys.stderr = stdout, stderr
+        os.environ.clear()
+        os.environ.update(original)
+
+
+def serve():
+    print("Initialising Maya..")
+    from maya import standalone, cmds
+    standalone.initialize()
+    cmds.loadPlugin("matrixNodes", quiet=True)
+
+    # Let conftest.py know Maya is already up
+    os.environ["CMDX_TESTSERVER"] = "1"
+
+    authkey = os.getenv("CMDX_TESTSERVER_AUTHKEY")
+    authkey = authkey.encode("utf-8") if authkey else _write_authkey()
+
+    listener = Listener(Address, authkey=authkey)
+    print("Listening on %s:%d.." % Address)
+
+    try:
+        while True:
+            try:
+                conn = listener.accept()
+            except AuthenticationError:
+                # A client without the key
+                continue
+
+            try:
+                command, argv, environ = conn.recv()
+
+                if command == "run":
+                    conn.send(("exit", _run(conn, argv, environ)))
+
+            except (EOFError, IOError):
+                # Client went away
+                pass
+
+            finally:
+                conn.close()
+
+    finally:
+        listener.close()
+
+        if not os.getenv("CMDX_TESTSERVER_AUTHKEY"):
+            os.remove(KeyFile)
+
+
+if __name__ == "__main__":
+    serve()